@@ -1,6 +1,11 @@
 import asyncio
+import sys
 from ollama import AsyncClient
 
+# history sent with each request, in user+assistant pairs, so the prompt
+# stays bounded however long the conversation runs
+MAX_TURNS = 20
+
 async def chatbot():
     client = AsyncClient(host='http://192.168.100.242:11434')
     messages = []
@@ -8,7 +13,8 @@ async def chatbot():
     print("Chatbot started! Type 'quit' or 'exit' to end the conversation.\n")
 
     while True:
-        user_input = input("You: ").strip()
+        # read in a thread so the loop stays free for cancellation and signals
+        user_input = (await asyncio.to_thread(input, "You: ")).strip()
 
         if user_input.lower() in ['quit', 'exit']:
             print("Goodbye!")
@@ -19,15 +25,24 @@ async def chatbot():
 
         messages.append({'role': 'user', 'content': user_input})
 
-        response = await client.chat(
+        # stream the reply so tokens show up as they are generated
+        sys.stdout.write("Assistant: ")
+        parts = []
+        async for chunk in await client.chat(
             model='llama3.1:8b-instruct-q4_K_M',
-            messages=messages
-        )
-
-        assistant_message = response['message']['content']
+            messages=messages,
+            stream=True
+        ):
+            content = chunk['message']['content']
+            sys.stdout.write(content)
+            sys.stdout.flush()
+            parts.append(content)
+        sys.stdout.write("\n\n")
+
+        assistant_message = ''.join(parts)
         messages.append({'role': 'assistant', 'content': assistant_message})
-
-        print(f"Assistant: {assistant_message}\n")
+        if len(messages) > MAX_TURNS * 2:
+            del messages[:-MAX_TURNS * 2]
 
 if __name__ == '__main__':
     asyncio.run(chatbot())
@@ -1,13 +1,28 @@
 # recorder_final.py  ←  keep this one forever
 import sounddevice as sd
 import numpy as np
-import wave
-import json
-import time
+import logging
+import os
+import struct
+import orjson
+import queue
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+logger = logging.getLogger("Segmizer")
+
+def _make_wav_header(nframes, samplerate, channels=1, sampwidth=2):
+    """44 byte RIFF/WAVE header for plain PCM data."""
+    data_size = nframes * channels * sampwidth
+    return struct.pack("<4sI4s4sIHHIIHH4sI",
+                       b"RIFF", 36 + data_size, b"WAVE",
+                       b"fmt ", 16, 1, channels, samplerate,
+                       samplerate * channels * sampwidth, channels * sampwidth, sampwidth * 8,
+                       b"data", data_size)
+
 class SegmentedAudioRecorder:
     def __init__(self, samplerate=48000, segment_sec=30.0, out_dir="raw_sound"):
         self.samplerate = samplerate
@@ -16,83 +31,204 @@ class SegmentedAudioRecorder:
         self.out_dir.mkdir(parents=True, exist_ok=True)
 
         self.stream = None
-        self.buffer = np.empty((0, 2), dtype="float32")   # always 2 channels internally
-        self.lock = threading.Lock()
+        self.channels = 2                                   # always 2 channels internally
+        # Preallocated ring buffer, room for a few segments so the writer
+        # can fall behind a little without the callback ever allocating
+        self.capacity = 4 * int(self.segment_sec * self.samplerate)
+        # captured as int16 straight from the device, which is what gets
+        # written out, so there is no per segment conversion
+        self.ring = np.zeros((self.capacity, self.channels), dtype="int16")
+        self._w = 0          # next write position
+        self._r = 0          # next read position
+        self._count = 0      # frames buffered
+        self.overruns = 0    # frames lost because the writer fell too far behind
+        need = int(self.segment_sec * self.samplerate)
+        # raw blocks from the audio callback, the writer thread owns the ring
+        self._queue = queue.SimpleQueue()
+        # The callback wakes the writer only once a full segment is queued.
+        # Each counter has a single writing thread, so no lock is needed
+        # to update them, only to wait.
+        self._need = need
+        self._frames_in = 0       # updated by the callback
+        self._frames_taken = 0    # updated by the writer
+        self._cond = threading.Condition()
         self.running = threading.Event()
         self.segments = []
+        self._io_pool = None
+        self._jsonl = None
+        self._writer_thread = None
+        # Two segment buffers, allocated once. The writer fills one while the
+        # I/O worker saves the other, and waits on a buffer's last save
+        # before filling it again.
+        self._seg_bufs = [np.empty((need, self.channels), dtype="int16") for _ in range(2)]
+        self._seg_saves = [None, None]
 
     def _callback(self, indata, frames, time_info, status):
-        with self.lock:
-            self.buffer = np.append(self.buffer, indata.copy(), axis=0)
+        # keep the audio thread to one copy and a queue put, and
+        # only take the lock when there is a segment's worth to write
+        self._queue.put_nowait(bytes(indata))
+        self._frames_in += frames
+        if self._frames_in - self._frames_taken >= self._need:
+            with self._cond:
+                self._cond.notify()
+
+    def _drain(self):
+        """Move any queued raw blocks into the ring."""
+        while True:
+            try:
+                raw = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            self._append(np.frombuffer(raw, dtype="int16").reshape(-1, self.channels))
+
+    def _append(self, block):
+        n = len(block)
+        capacity = self.capacity
+        end = self._w + n
+        if end <= capacity:
+            self.ring[self._w:end] = block
+        else:
+            split = capacity - self._w
+            self.ring[self._w:] = block[:split]
+            self.ring[:n - split] = block[split:]
+        self._w = end % capacity
+        self._count += n
+        if self._count > capacity:
+            # writer fell a whole buffer behind, oldest frames got overwritten
+            lost = self._count - capacity
+            self.overruns += lost
+            # lost frames will never be taken, count them as gone or
+            # segment_ready stays true and the writer spins
+            self._frames_taken += lost
+            self._r = (self._r + lost) % capacity
+            self._count = capacity
+
+    def _take(self, n, out):
+        """Copy the next n buffered frames out of the ring into out, return that view."""
+        capacity = self.capacity
+        end = self._r + n
+        seg = out[:n]
+        if end <= capacity:
+            np.copyto(seg, self.ring[self._r:end])
+        else:
+            split = capacity - self._r
+            np.copyto(seg[:split], self.ring[self._r:])
+            np.copyto(seg[split:], self.ring[:end - capacity])
+        self._r = end % capacity
+        self._count -= n
+        return seg
+
+    def _next_seg_buf(self, idx):
+        """Return the segment buffer for segment idx once its previous save is done."""
+        slot = idx % 2
+        pending = self._seg_saves[slot]
+        if pending is not None:
+            pending.exception()    # just waits, _save_done reports failures
+        return slot, self._seg_bufs[slot]
 
     def start_recording(self):
         if self.running.is_set():
             return
 
         self.segments.clear()
-        with self.lock:
-            self.buffer = np.empty((0, 2), dtype="float32")
+        self._w = self._r = self._count = 0
+        self.overruns = 0
+        self._queue = queue.SimpleQueue()
+        self._frames_in = self._frames_taken = 0
+        self._seg_saves = [None, None]
 
         try:
-            self.stream = sd.InputStream(
+            self.stream = sd.RawInputStream(
                 samplerate=self.samplerate,
                 device="hw:1,0",
-                channels=2,
-                dtype="float32",
+                channels=self.channels,
+                dtype="int16",
                 blocksize=2048,
                 latency="low",
                 callback=self._callback,
             )
             self.stream.start()
-            self.stream.start()
-            print("Microphone opened successfully (2 channels → saving as mono)")
+            logger.info("Microphone opened successfully (2 channels → saving as mono)")
         except Exception as e:
             raise RuntimeError(f"Failed to open mic: {e}")
 
+        # single worker so segments are written in order, while the
+        # writer thread goes straight back to collecting audio
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        self._jsonl = open(self.out_dir / "segments.jsonl", "ab", buffering=1 << 16)
         self.running.set()
         self.start_time = datetime.now(timezone.utc).isoformat()
-        threading.Thread(target=self._writer, daemon=True).start()
-        print(f"Recording started → {self.out_dir.resolve()}")
+        self._writer_thread = threading.Thread(target=self._writer, daemon=True)
+        self._writer_thread.start()
+        logger.info("Recording started → %s", self.out_dir.resolve())
 
     def _writer(self):
-        need = int(self.segment_sec * self.samplerate)
+        need = self._need
         idx = 0
+        # bound once, used on every pass through the loop
+        is_running = self.running.is_set
+        queue_empty = self._queue.empty
+        drain = self._drain
+        submit = self._io_pool.submit
+        save = self._save
+        save_done = self._save_done
+        next_seg_buf = self._next_seg_buf
+        seg_saves = self._seg_saves
+        cond = self._cond
 
-        while self.running.is_set() or len(self.buffer) >= need:
-            if len(self.buffer) < need:
-                time.sleep(0.02)
-                continue
+        def segment_ready():
+            return self._frames_in - self._frames_taken >= need or not is_running()
 
-            with self.lock:
-                seg = self.buffer[:need].copy()
-                self.buffer = self.buffer[need:]
+        while is_running() or not queue_empty() or self._count >= need:
+            with cond:
+                cond.wait_for(segment_ready, timeout=1.0)
+            drain()
+            if self._count < need:
+                continue
 
-            self._save(seg, idx)
+            slot, buf = next_seg_buf(idx)
+            seg = self._take(need, buf)
+            self._frames_taken += need
+            future = seg_saves[slot] = submit(save, seg, idx)
+            future.add_done_callback(save_done)
             idx += 1
 
         # Final partial segment
-        with self.lock:
-            if len(self.buffer) > 0:
-                seg = self.buffer.copy()
-                self.buffer = np.empty((0, 2), dtype="float32")
-                self._save(seg, idx, partial=True)
+        drain()
+        if self._count > 0:
+            self._frames_taken += self._count
+            slot, buf = next_seg_buf(idx)
+            seg = self._take(self._count, buf)
+            future = seg_saves[slot] = submit(save, seg, idx, partial=True)
+            future.add_done_callback(save_done)
+        self._io_pool.shutdown(wait=True)
+        self._jsonl.close()
 
-    def _save(self, audio_np, idx, partial=False):
-        audio_mono = audio_np[:, 0]                               # take left channel
-        # Optional software gain (uncomment if you speak very quietly)
-        # audio_mono = np.clip(audio_mono * 2.0, -1.0, 1.0)
+    def _save_done(self, future):
+        if future.exception() is not None:
+            logger.error("Failed to save segment: %r", future.exception())
 
-        audio_i16 = np.int16(audio_mono * 32767)
+    def _save(self, audio_np, idx, partial=False):
+        if audio_np.shape[1] == 1:
+            audio_i16 = audio_np.reshape(-1)                      # already mono, contiguous view
+        else:
+            # mix all channels down, summing in int32 so it can't overflow
+            audio_i16 = (audio_np.sum(axis=1, dtype=np.int32) // audio_np.shape[1]).astype(np.int16)
 
-        ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")[:-3]
+        # same UTC seconds+milliseconds stamp as before, without building a datetime
+        secs, ns = divmod(time.time_ns(), 1_000_000_000)
+        ts = f"{time.strftime('%Y%m%d_%H%M%S', time.gmtime(secs))}_{ns // 1_000_000:03d}"
         name = f"seg_{idx:04d}_{ts}.wav"
         wav_path = self.out_dir / name
 
-        with wave.open(str(wav_path), "wb") as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(self.samplerate)
-            wf.writeframes(audio_i16.tobytes())
+        # format is fixed, so write the header and samples in one go rather
+        # than going through the wave module's seek and patch on close
+        header = _make_wav_header(len(audio_i16), self.samplerate)
+        fd = os.open(wav_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.writev(fd, [header, audio_i16.tobytes()])
+        finally:
+            os.close(fd)
 
         dur = len(audio_np) / self.samplerate
         meta = {
@@ -105,19 +241,28 @@ class SegmentedAudioRecorder:
             "session_start_utc": self.start_time,
         }
         self.segments.append(meta)
-        (self.out_dir / f"{Path(name).stem}.json").write_text(json.dumps(meta, indent=2))
+        # one line per segment in a file kept open for the session, enough
+        # to recover the segment list if we never get to the manifest
+        self._jsonl.write(orjson.dumps(meta) + b"\n")
 
-        p = " (partial)" if partial else ""
-        print(f"→ {name}  ({dur:.2f}s){p}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("→ %s  (%.2fs)%s", name, dur, " (partial)" if partial else "")
 
     def stop_recording(self):
         if not self.running.is_set():
             return
         self.running.clear()
+        with self._cond:
+            self._cond.notify_all()
         if self.stream:
             self.stream.stop()
             self.stream.close()
-        time.sleep(0.6)   # give writer time to flush
+        # writer saves the final partial segment and waits for the I/O pool on its way out
+        # and the manifest has to wait for that, however long it takes
+        self._writer_thread.join(timeout=2.0)
+        if self._writer_thread.is_alive():
+            logger.warning("Writer still saving segments after 2s, waiting for it to finish")
+            self._writer_thread.join()
 
         manifest = {
             "session_start_utc": self.start_time,
@@ -127,10 +272,11 @@ class SegmentedAudioRecorder:
             "total_duration_sec": sum(s["duration_sec"] for s in self.segments),
             "segments": self.segments,
         }
-        (self.out_dir / "session_manifest.json").write_text(json.dumps(manifest, indent=2))
-        print(f"\nStopped — {len(self.segments)} segment(s) saved.\n")
+        (self.out_dir / "session_manifest.json").write_bytes(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+        logger.info("Stopped — %d segment(s) saved.", len(self.segments))
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     r = SegmentedAudioRecorder(segment_sec=15.0)
     input("Press Enter to start …")
     r.start_recording()
@@ -7,13 +7,12 @@ import time
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Optional
-import sounddevice as sd
-import soundfile as sf
 
 from palaver.scribe.text_events import TextEvent
 from palaver.scribe.audio_events import AudioEvent, AudioStopEvent, AudioStartEvent, AudioChunkEvent
 from palaver.scribe.api import ScribeAPIListener
 from palaver.scribe.draft_events import DraftEvent, DraftStartEvent, DraftEndEvent
+from palaver.utils.sound import play_sound_file
 
 logger = logging.getLogger("DefaultAPIWrapper")
 
@@ -24,11 +23,8 @@ class DefaultAPIWrapper(ScribeAPIListener):
         super().__init__()
         self.play_sound = play_sound
         self.play_signals = play_signals
-        self.full_text = ""
-        self.blocks = []
-        self.text_events = {}
-        self.last_block_name = None
         self.stream = None
+        self.stream_params = None # (sample_rate, channels, blocksize, datatype) of self.stream
         self.start_time = time.time()
         self.draft_recorder = draft_recorder
 
@@ -37,7 +33,10 @@ class DefaultAPIWrapper(ScribeAPIListener):
             pipeline.add_api_listener(self.draft_recorder)
 
     async def on_pipeline_shutdown(self):
-        pass
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+            self.stream_params = None
 
     async def on_draft_event(self, event: DraftEvent):
         now = time.time() 
@@ -64,23 +63,38 @@ class DefaultAPIWrapper(ScribeAPIListener):
     async def on_audio_event(self, event: AudioEvent):
         """Handle audio events - optionally play sound and finalize blocks."""
         if isinstance(event, AudioStartEvent):
-            pass
+            if self.play_sound:
+                # open the stream now so the first chunk doesn't
+                # have to wait for it
+                self.open_stream(event)
         elif isinstance(event, AudioStopEvent):
             logger.info("Got audio stop event %s", event)
         elif isinstance(event, AudioChunkEvent):
             if self.play_sound:
-                if not self.stream:
-                    self.stream = sd.OutputStream(
-                        samplerate=event.sample_rate,
-                        channels=event.channels,
-                        blocksize=event.blocksize,
-                        dtype=event.datatype,
-                    )
-                    self.stream.start()
-                    print("Opened audio playback stream")
+                self.open_stream(event)
                 audio = event.data
                 self.stream.write(audio)
 
+    def open_stream(self, event: AudioStartEvent | AudioChunkEvent):
+        """Make sure the playback stream is open and matches the event's audio format."""
+        params = (event.sample_rate, event.channels, event.blocksize, event.datatype)
+        if self.stream and params == self.stream_params:
+            return
+        if self.stream:
+            self.stream.close()
+        # imported here so that PortAudio only gets loaded
+        # when something is actually played
+        import sounddevice as sd
+        self.stream = sd.OutputStream(
+            samplerate=event.sample_rate,
+            channels=event.channels,
+            blocksize=event.blocksize,
+            dtype=event.datatype,
+        )
+        self.stream.start()
+        self.stream_params = params
+        print("Opened audio playback stream")
+
     async def play_draft_signal(self, kind: str):
         if kind == "new draft":
             file_path = Path(__file__).parent.parent / "signal_sounds" / "tos-computer-06.mp3"
@@ -89,23 +103,4 @@ class DefaultAPIWrapper(ScribeAPIListener):
         await self.play_signal_sound(file_path)
             
     async def play_signal_sound(self, file_path):
-        sound_file = sf.SoundFile(file_path)
-        sr = sound_file.samplerate
-        channels = sound_file.channels
-        chunk_duration  = 0.03
-        frames_per_chunk = max(1, int(round(chunk_duration * sr)))
-        out_stream = sd.OutputStream(
-            samplerate=sr,
-            channels=channels,
-            blocksize=frames_per_chunk,
-            dtype="float32",
-        )
-        out_stream.start()
-
-        while True:
-            data = sound_file.read(frames=frames_per_chunk, dtype="float32", always_2d=True)
-            if data.shape[0] == 0:
-                break
-            out_stream.write(data)
-        out_stream.close()
-        sound_file.close()
+        await play_sound_file(file_path)
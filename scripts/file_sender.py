@@ -10,11 +10,11 @@ import argparse
 import logging
 from pathlib import Path
 from typing import Optional
-import json
 from dataclasses import asdict
 
 import websockets
 import numpy as np
+import orjson
 
 from palaver.utils.top_error import TopErrorHandler, TopLevelCallback
 from palaver.scribe.audio.file_listener import FileListener
@@ -41,24 +41,21 @@ class WebSocketEventSender(AudioEventListener):
         # Serialize the event to JSON
         event_dict = asdict(event)
 
-        # Convert numpy arrays to lists for JSON serialization
-        if isinstance(event, AudioChunkEvent):
-            event_dict['data'] = event.data.tolist()
-
         # Add event type for receiver to identify
         event_dict['event_type'] = event.event_type.value
         event_dict['event_class'] = event.__class__.__name__
 
-        # Send as JSON
-        await self.websocket.send(json.dumps(event_dict))
+        # Send as JSON, orjson writes the chunk's ndarray as a plain list
+        # itself so there is no tolist() pass first
+        await self.websocket.send(orjson.dumps(event_dict, option=orjson.OPT_SERIALIZE_NUMPY).decode())
 
         self._event_count += 1
         if isinstance(event, AudioStartEvent):
-            logger.info(f"Sent AudioStartEvent")
+            logger.info("Sent AudioStartEvent")
         elif isinstance(event, AudioStopEvent):
-            logger.info(f"Sent AudioStopEvent (total events: {self._event_count})")
+            logger.info("Sent AudioStopEvent (total events: %d)", self._event_count)
         elif isinstance(event, AudioChunkEvent) and self._event_count % 100 == 0:
-            logger.debug(f"Sent {self._event_count} audio events...")
+            logger.debug("Sent %d audio events...", self._event_count)
 
 
 async def send_file_to_server(file_path: Path, server_url: str) -> int:
@@ -67,9 +64,9 @@ async def send_file_to_server(file_path: Path, server_url: str) -> int:
 
     async def main_loop():
         # Construct full websocket URL
-        logger.info(f"Connecting to {server_url}")
-        logger.info(f"Sending audio from: {file_path}")
-        async with websockets.connect(server_url) as websocket:
+        logger.info("Connecting to %s", server_url)
+        logger.info("Sending audio from: %s", file_path)
+        async with websockets.connect(server_url, compression=None) as websocket:
             logger.info("WebSocket connected")
 
             # Create event sender
@@ -93,7 +90,7 @@ async def send_file_to_server(file_path: Path, server_url: str) -> int:
                     except asyncio.CancelledError:
                         logger.info("Reader task cancelled")
 
-            logger.info(f"File streaming complete ({event_sender._event_count} events sent)")
+            logger.info("File streaming complete (%d events sent)", event_sender._event_count)
             return event_sender._event_count
 
     background_error_dict = None
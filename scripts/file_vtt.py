@@ -89,7 +89,7 @@ def main():
     if args.output_dir:
         sim_timing = False
         draft_recorder = SQLDraftRecorder(args.output_dir)
-        logger.info(f"Draft recorder enabled: {args.output_dir}")
+        logger.info("Draft recorder enabled: %s", args.output_dir)
 
     # Create API wrapper with optional sound playback
     api_wrapper = DefaultAPIWrapper(draft_recorder=draft_recorder, play_sound=args.play_sound)
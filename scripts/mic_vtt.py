@@ -57,7 +57,7 @@ def main():
     draft_recorder = None
     if args.output_dir:
         draft_recorder = SQLDraftRecorder(args.output_dir)
-        logger.info(f"Draft recorder enabled: {args.output_dir}")
+        logger.info("Draft recorder enabled: %s", args.output_dir)
 
     # Create API wrapper
     api_wrapper = DefaultAPIWrapper(draft_recorder=draft_recorder)
@@ -65,7 +65,7 @@ def main():
     wav_recorder = None
     if args.wav:
         wav_recorder = WavAudioRecorder(args.wav)
-        logger.info(f"Wav recorder enabled: {args.wav}")
+        logger.info("Wav recorder enabled: %s", args.wav)
     try:
         async def main_task():
             # Create listener
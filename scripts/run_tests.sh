@@ -1,5 +1,6 @@
 #!/bin/bash
-# Run tests sequentially to avoid whispercpp core dumps
+# Run tests sequentially to avoid whispercpp core dumps, except the pure
+# python ones in PARALLEL_FILES which are safe to spread over xdist workers
 # Coverage accumulates across runs (uses --cov-append from pytest.ini)
 
 set -e  # Exit on error
@@ -15,10 +16,18 @@ echo -e "${BLUE}Running tests sequentially...${NC}"
 echo -e "${BLUE}========================================${NC}"
 echo ""
 
-# Array of test files to run
-TEST_FILES=(
+# Test files that never load whisper, run together with pytest-xdist
+PARALLEL_FILES=(
     "tests/test_top_error.py"
     "tests/test_draft_builder.py"
+    "tests/test_serializers.py"
+    "tests/test_net_listener.py"
+    "tests/test_downsampler.py"
+)
+
+# Array of test files to run
+TEST_FILES=(
+    "tests/test_whisper_worker.py"
     "tests/test_file_audio_to_text.py"
     "tests/test_mic_mock_to_text.py"
     "tests/test_file_sender_example.py"
@@ -30,6 +39,16 @@ TEST_FILES=(
 # Track failures
 FAILED_TESTS=()
 
+echo -e "${BLUE}Running in parallel: ${PARALLEL_FILES[*]}${NC}"
+echo "----------------------------------------"
+if uv run pytest "${PARALLEL_FILES[@]}" -n auto -v; then
+    echo -e "${GREEN}✓ PASSED${NC}"
+else
+    echo -e "${RED}✗ FAILED${NC}"
+    FAILED_TESTS+=("${PARALLEL_FILES[@]}")
+fi
+echo ""
+
 # Run each test file
 for test in "${TEST_FILES[@]}"; do
     echo -e "${BLUE}Running: ${test}${NC}"
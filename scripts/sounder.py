@@ -1,8 +1,7 @@
 #!/usr/bin/env python
 import asyncio
 from pathlib import Path
-import soundfile as sf
-import sounddevice as sd
+from palaver.utils.sound import play_sound_file
 
 async def play_signal_sound(signal):
     if signal == "new draft":
@@ -14,26 +13,7 @@ async def play_signal_sound(signal):
         
         
 async def play_sound(file_path):
-    sound_file = sf.SoundFile(file_path)
-    sr = sound_file.samplerate
-    channels = sound_file.channels
-    chunk_duration  = 0.03
-    frames_per_chunk = max(1, int(round(chunk_duration * sr)))
-    out_stream = sd.OutputStream(
-        samplerate=sr,
-        channels=channels,
-        blocksize=frames_per_chunk,
-        dtype="float32",
-    )
-    out_stream.start()
-
-    while True:
-        data = sound_file.read(frames=frames_per_chunk, dtype="float32", always_2d=True)
-        if data.shape[0] == 0:
-            break
-        out_stream.write(data)
-    out_stream.close()
-    sound_file.close()
+    await play_sound_file(file_path)
 
 async def main():
 
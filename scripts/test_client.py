@@ -4,17 +4,22 @@
 Connects to the Event Net Server, subscribes to events, and prints them.
 """
 import asyncio
-import json
+import orjson
 import argparse
 from pprint import pprint
 from typing import Set
 
 import websockets
+try:
+    import uvloop
+except ImportError:
+    # not available on Windows, fall back to the stock loop
+    uvloop = None
 
 from palaver.scribe.audio_events import AudioChunkEvent
 from palaver.scribe.text_events import TextEvent
 from palaver.scribe.draft_events import DraftEvent
-from palaver.utils.serializers import event_from_dict
+from palaver.utils.serializers import event_from_dict, serialize_event, EVENT_PROTOCOL_VERSION
 
 
 async def main():
@@ -34,25 +39,33 @@ async def main():
     
     print(f"Connecting to {args.url}...")
 
-    async with websockets.connect(args.url) as websocket:
+    async with websockets.connect(args.url, compression=None, max_size=2**20, max_queue=1024) as websocket:
         print(f"Connected! Subscribing to: all")
 
         # Send subscription message
-        subscription = {"subscribe": ['all']}
-        await websocket.send(json.dumps(subscription))
+        subscription = {"subscribe": ['all'], "protocol": EVENT_PROTOCOL_VERSION}
+        await websocket.send(orjson.dumps(subscription).decode())
         print("Subscription sent. Waiting for events...\n")
 
         chunk_count = 0
+        next_seq = None
         try:
             async for message in websocket:
-                event_dict = json.loads(message)
+                event_dict = orjson.loads(message)
+                seq = event_dict.get('seq')
+                if seq is not None:
+                    if next_seq is not None and seq != next_seq:
+                        print(f"Gap in event stream, expected seq {next_seq} got {seq}")
+                    next_seq = seq + 1
                 event = event_from_dict(event_dict)
                 if isinstance(event, AudioChunkEvent):
                     if chunk_count % 100 == 0:
                         pprint(event)
                     chunk_count += 1
                 else:
-                    pprint(event)
+                    # orjson is much cheaper than pprint for big drafts, and
+                    # this runs inline with the websocket reads
+                    print(orjson.dumps(serialize_event(event), option=orjson.OPT_INDENT_2).decode())
 
         except websockets.exceptions.ConnectionClosed:
             print("\nConnection closed by server")
@@ -61,4 +74,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
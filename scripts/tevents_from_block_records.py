@@ -12,8 +12,6 @@ from palaver.scribe.command_events import (ScribeCommand,
 
 from palaver.scribe.scriven.wire_commands import CommandDispatch
 from loggers import setup_logging
-import soundfile as sf
-import sounddevice as sd
 
 
 async def get_text_events(path, printing=False):
@@ -115,14 +115,20 @@ async def main():
                             draft_recorder=draft_recorder,
                             port=args.port,
                             mode=mode)
-    logger.info(f"Starting server on {args.host}:{args.port}")
+    logger.info("Starting server on %s:%s", args.host, args.port)
 
 
     config = uvicorn.Config(
         server.app,
         host=args.host,
         port=args.port,
-        log_level=args.log_level.lower()
+        log_level=args.log_level.lower(),
+        # let REST clients reuse connections across draft fetches and
+        # put a predictable cap on concurrent connections
+        timeout_keep_alive=30,
+        limit_concurrency=100,
+        # audio sample payloads don't compress, deflate is just cpu cost
+        ws_per_message_deflate=False,
     )
     
     server = uvicorn.Server(config)
@@ -6,6 +6,7 @@ import json
 import time
 
 import websockets
+from websockets.exceptions import ConnectionClosed
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query, Path, HTTPException
 
@@ -23,6 +24,11 @@ class DraftRouter:
         self.ws_base_url = None
         self.audio_url = None
         self.last_rescanner_registration: Optional[float] = None
+        # Long lived client connections to the audio server, keyed by url,
+        # so the once a second rescanner heartbeat and the draft pushes
+        # don't pay a connect handshake on every call.
+        self._client_connections: dict[str, Any] = {}
+        self._client_locks: dict[str, asyncio.Lock] = {}
 
     async def become_router(self):
         router = APIRouter()
@@ -32,14 +38,19 @@ class DraftRouter:
         @router.websocket("/new_draft")
         async def submit_draft(fapi_ws: WebSocket):
             await fapi_ws.accept()
-            data = await fapi_ws.receive_json()
-            draft = draft_from_dict(data)
-            logger.info("Received new draft %s with parent %s on websocket",
-                        draft.draft_id, draft.parent_draft_id)
-            await self.server.pipeline.draft_maker.import_draft(draft)
-            logger.info("Posted new draft to draft_maker")
-            logger.debug("new draft text %s", draft.full_text)
-            await fapi_ws.send_json({'code': 'success'})
+            # Clients may keep the connection open and send many drafts
+            try:
+                while True:
+                    data = await fapi_ws.receive_json()
+                    draft = draft_from_dict(data)
+                    logger.info("Received new draft %s with parent %s on websocket",
+                                draft.draft_id, draft.parent_draft_id)
+                    await self.server.pipeline.draft_maker.import_draft(draft)
+                    logger.info("Posted new draft to draft_maker")
+                    logger.debug("new draft text %s", draft.full_text)
+                    await fapi_ws.send_json({'code': 'success'})
+            except WebSocketDisconnect:
+                pass
 
         @router.get("/drafts")
         async def list_drafts(
@@ -101,7 +112,7 @@ class DraftRouter:
             except HTTPException:
                 raise
             except Exception as e:
-                logger.error(f"Error listing drafts: {e}", exc_info=True)
+                logger.error("Error listing drafts: %s", e, exc_info=True)
                 raise HTTPException(status_code=500, detail="Database query failed")
 
         @router.get("/drafts/{draft_id}")
@@ -152,30 +163,46 @@ class DraftRouter:
             except HTTPException:
                 raise
             except Exception as e:
-                logger.error(f"Error getting draft {draft_id}: {e}", exc_info=True)
+                logger.error("Error getting draft %s: %s", draft_id, e, exc_info=True)
                 raise HTTPException(status_code=500, detail="Database query failed")
 
         return router            
 
-    async def register_rescanner(self):
+    async def _client_request(self, path, payload: str):
+        """ Send payload on the long lived connection for path and return the reply,
+        reconnecting once if the server dropped the connection since the last call."""
         if self.audio_url is None:
             raise Exception('need audio url')
-        url = self.audio_url + "/register_rescanner"
-        async with websockets.connect(url) as websocket:
-            await websocket.send(json.dumps({'url': self.ws_base_url}))
-            data  = await websocket.recv()
+        url = self.audio_url + path
+        lock = self._client_locks.setdefault(url, asyncio.Lock())
+        async with lock:
+            for attempt in range(2):
+                websocket = self._client_connections.get(url)
+                if websocket is None:
+                    websocket = await websockets.connect(url, open_timeout=5.0)
+                    self._client_connections[url] = websocket
+                try:
+                    await websocket.send(payload)
+                    return await websocket.recv()
+                except ConnectionClosed:
+                    self._client_connections.pop(url, None)
+                    if attempt > 0:
+                        raise
+
+    async def register_rescanner(self):
+        await self._client_request("/register_rescanner", json.dumps({'url': self.ws_base_url}))
         
     async def send_new_draft(self, draft):
-        if self.audio_url is None:
-            raise Exception('need audio url')
-        url = self.audio_url + "/new_draft"
         data = serialize_value(draft)
         jdata = json.dumps(data)
-        async with websockets.connect(url) as websocket:
-            await websocket.send(jdata)
-            data  = await websocket.recv()
-            await asyncio.sleep(0.01)
-            logger.info("New draft push result %s ", data)
+        data = await self._client_request("/new_draft", jdata)
+        logger.info("New draft push result %s ", data)
 
-        
-        
+    async def close(self):
+        connections = list(self._client_connections.values())
+        self._client_connections = {}
+        for websocket in connections:
+            try:
+                await websocket.close()
+            except Exception as e:
+                logger.warning("Error closing client connection: %s", e)
@@ -19,7 +19,8 @@ from palaver.scribe.audio_events import (
 )
 from palaver.scribe.text_events import TextEvent
 from palaver.scribe.draft_events import DraftEvent, DraftStartEvent, DraftEndEvent
-from palaver.utils.serializers import serialize_event
+from palaver.utils.serializers import serialize_event, EVENT_PROTOCOL_V1
+from palaver.utils.serializers import all_event_names, all_but_chunks_event_names
 
 
 logger = logging.getLogger("EventRouter")
@@ -33,23 +34,32 @@ class EventRouter:
         self.uri = f"http://{self.hostname}:{self.my_port}/routes"
 
         self.active_connections: dict[WebSocket, set[str]] = {}
+        # wire protocol version each client asked for in its subscription
+        self.connection_protocols: dict[WebSocket, int] = {}
+        # next sequence number for each client, lets clients detect dropped events
+        self.connection_seqs: dict[WebSocket, int] = {}
 
     async def send_event(self, event: AudioEvent | TextEvent | DraftEvent):
         if event.author_uri is None:
             event.author_uri = self.uri
         await self._send_to_subscribers(event)
 
-    async def _connect(self, websocket: WebSocket, event_types: set[str]):
+    async def _connect(self, websocket: WebSocket, event_types: set[str],
+                       protocol: int = EVENT_PROTOCOL_V1):
         """Register a websocket with its event type subscriptions."""
         self.active_connections[websocket] = event_types
-        logger.info(f"Client connected and subscribed to: {event_types}")
-        logger.info(f"Total event clients: {len(self.active_connections)}")
+        self.connection_protocols[websocket] = protocol
+        self.connection_seqs[websocket] = 0
+        logger.info("Client connected and subscribed to: %s", event_types)
+        logger.info("Total event clients: %d", len(self.active_connections))
 
     def _disconnect(self, websocket: WebSocket):
         """Remove a disconnected websocket."""
         if websocket in self.active_connections:
             del self.active_connections[websocket]
-            logger.info(f"Client disconnected. Remaining: {len(self.active_connections)}")
+            self.connection_protocols.pop(websocket, None)
+            self.connection_seqs.pop(websocket, None)
+            logger.info("Client disconnected. Remaining: %d", len(self.active_connections))
 
     async def _send_to_subscribers(self, event):
         """Send event to all subscribed websockets."""
@@ -57,15 +67,24 @@ class EventRouter:
             return
 
         event_type = str(event.__class__)
-        event_dict = serialize_event(event)
         if event.author_uri is None:
             event.author_uri = self.uri
 
+        # serialize at most once per protocol version in use
+        event_dicts = {}
         disconnected = []
         for ws, subscribed in list(self.active_connections.items()):
             if event_type in subscribed:
+                protocol = self.connection_protocols.get(ws, EVENT_PROTOCOL_V1)
+                event_dict = event_dicts.get(protocol)
+                if event_dict is None:
+                    event_dict = serialize_event(event, protocol)
+                    event_dicts[protocol] = event_dict
+                seq = self.connection_seqs.get(ws, 0)
                 try:
-                    await ws.send_json(event_dict)
+                    await ws.send_json({**event_dict, 'seq': seq})
+                    # only count events that actually went out
+                    self.connection_seqs[ws] = seq + 1
                 except Exception:
                     logger.error("Error sending to client", exc_info=False)
                     disconnected.append(ws)
@@ -74,30 +93,14 @@ class EventRouter:
             self._disconnect(ws)
 
     def expand_event_types(self, in_types: list):
-        main_types = {
-                str(AudioStartEvent),
-                str(AudioStopEvent),
-                str(AudioSpeechStartEvent),
-                str(AudioSpeechStopEvent),
-                str(AudioErrorEvent),
-                str(TextEvent),
-                str(DraftStartEvent),
-                str(DraftEndEvent),
-        }
-        valid = set(main_types)
-        valid.add(str(AudioChunkEvent))
-
-        if 'all_but_chunks' in in_types or 'all' in in_types:
-            r_types = set(main_types)
-            if not "all_but_chunks" in event_types:
-                r_types.add(str(AudioChunkEvent))
-        else:
-            for in_type in in_types:
-                if in_type not in valid:
-                    raise Exception(f'invalid type requested {in_type}')
-            r_types = in_types
-        r_types = set(r_types)
-        return r_types
+        if 'all_but_chunks' in in_types:
+            return set(all_but_chunks_event_names)
+        if 'all' in in_types:
+            return set(all_event_names)
+        for in_type in in_types:
+            if in_type not in all_event_names:
+                raise Exception(f'invalid type requested {in_type}')
+        return set(in_types)
 
     async def become_router(self):
         router = APIRouter()
@@ -113,15 +116,20 @@ class EventRouter:
                     return
 
                 event_types = self.expand_event_types(event_types)
-                await self._connect(websocket, event_types)
+                protocol = int(data.get("protocol", EVENT_PROTOCOL_V1))
+                await self._connect(websocket, event_types, protocol)
 
-                # Keep alive
+                # Nothing more is expected from the client, so just park
+                # here until it goes away rather than waking up to poll
                 while True:
-                    await asyncio.sleep(1)
+                    message = await websocket.receive()
+                    if message["type"] == "websocket.disconnect":
+                        break
+                self._disconnect(websocket)
             except WebSocketDisconnect:
                 self._disconnect(websocket)
             except Exception as e:
-                logger.error(f"Disconnecting client on error in /events: {e}", exc_info=True)
+                logger.error("Disconnecting client on error in /events: %s", e, exc_info=True)
                 self._disconnect(websocket)
 
         return router            
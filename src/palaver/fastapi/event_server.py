@@ -9,8 +9,6 @@ from typing import Optional
 import json
 
 from fastapi import FastAPI
-import sounddevice as sd
-import soundfile as sf
 import websockets
 
 from palaver.scribe.core import PipelineConfig, ScribePipeline
@@ -18,6 +16,7 @@ from palaver.scribe.api import ScribeAPIListener
 from palaver.scribe.recorders.sql_drafts import SQLDraftRecorder
 from palaver.scribe.audio_listeners import AudioListenerCCSMixin
 from palaver.utils.top_error import TopErrorHandler, TopLevelCallback, ERROR_HANDLER
+from palaver.utils.sound import play_sound_file
 from palaver.fastapi.index_router import IndexRouter
 from palaver.fastapi.event_router import EventRouter
 from palaver.fastapi.draft_router import DraftRouter
@@ -97,26 +96,7 @@ class NormalListener(ScribeAPIListener):
         await self.play_signal_sound(file_path)
             
     async def play_signal_sound(self, file_path):
-        sound_file = sf.SoundFile(file_path)
-        sr = sound_file.samplerate
-        channels = sound_file.channels
-        chunk_duration  = 0.03
-        frames_per_chunk = max(1, int(round(chunk_duration * sr)))
-        out_stream = sd.OutputStream(
-            samplerate=sr,
-            channels=channels,
-            blocksize=frames_per_chunk,
-            dtype="float32",
-        )
-        out_stream.start()
-
-        while True:
-            data = sound_file.read(frames=frames_per_chunk, dtype="float32", always_2d=True)
-            if data.shape[0] == 0:
-                break
-            out_stream.write(data)
-        out_stream.close()
-        sound_file.close()
+        await play_sound_file(file_path)
 
 
 class ServerMode(str, Enum):
@@ -189,7 +169,7 @@ class EventNetServer:
         # Setup error handler for pipeline context
         class ErrorCallback(TopLevelCallback):
             async def on_error(self, error_dict: dict):
-                logger.error(f"Pipeline error: {error_dict}")
+                logger.error("Pipeline error: %s", error_dict)
 
         error_handler = TopErrorHandler(top_level_callback=ErrorCallback(), logger=logger)
         token = ERROR_HANDLER.set(error_handler)
@@ -69,12 +69,17 @@ class IndexRouter:
         @router.websocket("/register_rescanner")
         async def register_rescanner(websocket: WebSocket):
             await websocket.accept()
-            data = await websocket.receive_json()
-            self.rescanner = data['url']
-            self.last_rescanner_registration = time.time()
-            logger.debug(f"Rescanner registered from {self.rescanner}")
-            res = {'code': 'success'}
-            await websocket.send_json(res)
+            # Rescanner keeps this open and sends a heartbeat registration every second
+            try:
+                while True:
+                    data = await websocket.receive_json()
+                    self.rescanner = data['url']
+                    self.last_rescanner_registration = time.time()
+                    logger.debug("Rescanner registered from %s", self.rescanner)
+                    res = {'code': 'success'}
+                    await websocket.send_json(res)
+            except WebSocketDisconnect:
+                pass
         
 
         @router.websocket("/get_rescanner")
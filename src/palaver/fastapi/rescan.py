@@ -87,7 +87,7 @@ class Rescanner(AudioListenerCCSMixin, ScribeAPIListener):
                 try:
                     await self.server.draft_router.register_rescanner()
                 except Exception as e:
-                    self.logger.warning(f"Heartbeat registration failed: {e}")
+                    self.logger.warning("Heartbeat registration failed: %s", e)
                 await asyncio.sleep(1.0)
         except asyncio.CancelledError:
             self.logger.info("Heartbeat task cancelled")
@@ -100,6 +100,7 @@ class Rescanner(AudioListenerCCSMixin, ScribeAPIListener):
                 await self._heartbeat_task
             except asyncio.CancelledError:
                 pass
+        await self.server.draft_router.close()
         await self.audio_listener.stop_streaming()
 
     def get_audio_url(self):
@@ -112,6 +113,7 @@ class Rescanner(AudioListenerCCSMixin, ScribeAPIListener):
                 await self._heartbeat_task
             except asyncio.CancelledError:
                 pass
+        await self.server.draft_router.close()
         await self.audio_listener.stop_streaming()
         
     async def on_draft_event(self, event: DraftEvent):
@@ -202,7 +202,7 @@ class UIRouter:
             'event': event,
             'timestamp': time.time()
         })
-        logger.debug(f"Added {event.__class__.__name__} to event buffer (seq={self.event_sequence})")
+        logger.debug("Added %s to event buffer (seq=%d)", event.__class__.__name__, self.event_sequence)
 
     def _format_event_html(self, event):
         """Format an event as HTML fragment."""
@@ -1,6 +1,9 @@
 from copy import deepcopy
+from math import gcd
 import numpy as np
 import resampy
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import firwin
 from eventemitter import AsyncIOEventEmitter
 
 from palaver.scribe.audio_events import (
@@ -10,6 +13,55 @@ from palaver.scribe.audio_events import (
     AudioEventListener,
 )
 
+class PolyphaseResampler:
+    """ Rational ratio resampler, e.g. 48000 -> 16000 (1/3) or 44100 -> 16000
+    (160/441). The low pass filter is designed once and split into one small
+    filter per output phase, so each output sample is a single short dot product
+    over the input it depends on, and nothing is computed for the samples a plain
+    upsample, filter, decimate would throw away. The filter history and output
+    position carry over from one chunk to the next, so the stream is resampled
+    as a whole rather than chunk by chunk."""
+
+    def __init__(self, src_rate: int, dst_rate: int, channels: int, taps_per_phase: int = 16):
+        g = gcd(src_rate, dst_rate)
+        up = self.up = dst_rate // g
+        down = self.down = src_rate // g
+        numtaps = taps_per_phase * max(up, down)
+        numtaps += -numtaps % up
+        taps = firwin(numtaps, 1.0 / max(up, down), window=('kaiser', 8.0)) * up
+        # the whole low pass filter, gain included, before it is split into phases
+        self.taps = taps
+        q = self.q = numtaps // up
+        # bank[phase] holds that phase's taps reversed, to line up with a window
+        # of the last q input samples
+        bank = taps.reshape(q, up).T[:, ::-1]
+        # output n uses phase (n * down) % up, so store the phases in that order,
+        # then a chunk's filters are a slice starting at the first output's place
+        self._bank_period = np.ascontiguousarray(bank[(np.arange(up) * down) % up], dtype=np.float32)
+        self._bank_seq = self._bank_period
+        self._inv_down = pow(down, -1, up) if up > 1 else 0
+        self.history = np.zeros((q - 1, channels), dtype=np.float32)
+        # position of the next output, in upsampled samples from the start of history
+        self.t = (q - 1) * up
+
+    def process(self, data: np.ndarray) -> np.ndarray:
+        up, down, q = self.up, self.down, self.q
+        x = np.concatenate((self.history, data.astype(np.float32, copy=False)))
+        nout = max(0, -(-(len(x) * up - self.t) // down))
+        starts = (self.t + down * np.arange(nout)) // up - (q - 1)
+        first = (self.t * self._inv_down) % up if up > 1 else 0
+        if first + nout > len(self._bank_seq):
+            self._bank_seq = np.tile(self._bank_period, (-(-(first + nout) // up), 1))
+        filters = self._bank_seq[first:first + nout]
+        out = np.empty((nout, x.shape[1]), dtype=np.float32)
+        for c in range(x.shape[1]):
+            windows = sliding_window_view(x[:, c], q)[starts]
+            out[:, c] = np.einsum('nq,nq->n', filters, windows)
+        self.t += nout * down - (len(x) - (q - 1)) * up
+        self.history = x[len(x) - (q - 1):]
+        return out
+
+
 class DownSampler(AudioEventListener):
     
     def __init__(self, target_samplerate:int, target_channels:int, quality: str = "kaiser_fast"):
@@ -17,9 +69,23 @@ class DownSampler(AudioEventListener):
         self.target_ch = target_channels
         self.quality = quality  # kaiser_fast is fast & excellent; use "sinc_best" if you want absolute max quality
         self.emitter = AsyncIOEventEmitter()
+        self._resampler = None
+        self._resampler_key = None
+
+    def _get_resampler(self, src_sr, src_ch):
+        """ Resampler for the current stream, None if the source rate is not a whole number """
+        if src_sr != int(src_sr):
+            return None
+        key = (int(src_sr), src_ch)
+        if key != self._resampler_key:
+            self._resampler = PolyphaseResampler(int(src_sr), self.target_sr, src_ch)
+            self._resampler_key = key
+        return self._resampler
 
     async def convert(self, event):
         if isinstance(event, AudioStartEvent):
+            # new stream, don't filter across the gap from the last one
+            self._resampler_key = None
             new_event = deepcopy(event)
             if self.target_sr is not None and self.target_sr != new_event.sample_rate:
                 new_event.sample_rate = self.target_sr
@@ -39,7 +105,11 @@ class DownSampler(AudioEventListener):
             src_ch = src_ch[1]
 
         if src_sr != self.target_sr and self.target_sr is not None:
-            data = resampy.resample(data, src_sr, self.target_sr, filter=self.quality, axis=0)
+            resampler = self._get_resampler(src_sr, src_ch) if data.ndim == 2 else None
+            if resampler is not None:
+                data = resampler.process(data)
+            else:
+                data = resampy.resample(data, src_sr, self.target_sr, filter=self.quality, axis=0)
 
         # ── Channel conversion ───────────────────────────
         if src_ch != self.target_ch and self.target_ch is not None:
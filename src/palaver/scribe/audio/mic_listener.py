@@ -104,8 +104,10 @@ class MicListener(AudioListenerCCSMixin, AudioListener):
             def callback(indata, outdata, frame_count, time_info, status):
                 loop.call_soon_threadsafe(self._q_out.put_nowait, (indata.copy(), status))
 
+            # sounddevice defaults to the device's high latency setting, which
+            # queues several periods before we see the first callback
             self._stream = sd.Stream(blocksize=self._blocksize, callback=callback, dtype=self._dtype,
-                                     channels=self._channels)
+                                     channels=self._channels, latency='low')
             self._blocksize = self._stream.blocksize
             self._samplerate = self._stream.samplerate
             self._channels = self._stream.channels
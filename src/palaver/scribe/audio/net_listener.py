@@ -6,7 +6,7 @@ import os
 import time
 import logging
 import traceback
-import json
+import orjson
 from datetime import datetime
 import websockets
 import numpy as np
@@ -19,11 +19,15 @@ from palaver.scribe.audio_events import AudioStartEvent, AudioChunkEvent, AudioS
 from palaver.scribe.audio_events import AudioEvent, AudioEventType, AudioSpeechStartEvent, AudioSpeechStopEvent
 from palaver.scribe.text_events import TextEvent, TextEventListener
 from palaver.scribe.draft_events import DraftEvent, DraftEventListener, DraftStartEvent, DraftEndEvent
-from palaver.utils.serializers import event_from_dict
+from palaver.utils.serializers import event_and_group_from_dict, EVENT_PROTOCOL_VERSION
+from palaver.utils.serializers import audio_event_names, text_event_names, draft_event_names
 
 
 logger = logging.getLogger("NetListener")
 
+# put on the event queue by the reader when it is done, tells the dispatcher to stop
+_READER_DONE = None
+
 class NetListener(AudioListenerCCSMixin, AudioListener):
     """ Implements the Listener interface by receiving
     audio data from some network source that sends
@@ -38,13 +42,32 @@ class NetListener(AudioListenerCCSMixin, AudioListener):
         self._running = False
         self._paused = False
         self._reader_task = None
-        self._event_queue = asyncio.Queue()
+        self._dispatch_task = None
+        # Raw messages wait here between the websocket reader and the
+        # dispatcher, so a burst doesn't stall the websocket receive.
+        # When full the reader waits, nothing is dropped: this is an audio
+        # source, and losing chunks or start/stop events would break VAD
+        # and transcription downstream. The wait pushes back on the server
+        # through the websocket's own flow control.
+        self._event_queue = asyncio.Queue(maxsize=1024)
+        # EventRouter numbers the events it sends us, a jump means events were lost
+        self._next_seq = None
+        self.gaps = 0
         self._client = None
         self._audio_url = audio_url
         self._audio_only = audio_only
         self._text_emitter = AsyncIOEventEmitter()
         self._draft_emitter = AsyncIOEventEmitter()
         self._websocket = None
+        self._chunk_count = 0
+        # event classes we subscribed to, set when the subscription is sent
+        self._wanted = frozenset()
+        # keyed by the group names in serializers.event_type_groups
+        self._group_handlers = {
+            'audio': self._dispatch_audio,
+            'text': self._dispatch_text,
+            'draft': self._dispatch_draft,
+        }
 
     async def set_in_speech(self, value):
         # only used when
@@ -97,6 +120,7 @@ class NetListener(AudioListenerCCSMixin, AudioListener):
         if self._running:
             return
 
+        self._dispatch_task = get_error_handler().wrap_task(self._dispatcher)
         self._reader_task = get_error_handler().wrap_task(self._reader)
         self._running = True
 
@@ -113,50 +137,24 @@ class NetListener(AudioListenerCCSMixin, AudioListener):
         if not self._running:
             return
         try:
-            async with websockets.connect(f"{self._audio_url}/events") as websocket:
+            # Audio payloads don't compress, so skip deflate. Allow a deep
+            # receive queue ahead of our own _event_queue.
+            async with websockets.connect(f"{self._audio_url}/events",
+                                          compression=None, max_size=2**20, max_queue=1024) as websocket:
                 self._websocket = websocket
-                events = [str(AudioStartEvent),
-                          str(AudioStopEvent),
-                          str(AudioChunkEvent),
-                          str(AudioSpeechStartEvent),
-                          str(AudioSpeechStopEvent),
-                          str(AudioErrorEvent)]
+                # a new connection starts a new sequence
+                self._next_seq = None
+                events = list(audio_event_names)
                 if not self._audio_only:
-                    events += [str(TextEvent),
-                               str(DraftStartEvent),
-                               str(DraftEndEvent),
-                               ]
-                subscription = {"subscribe": events}
-                await websocket.send(json.dumps(subscription))
-                regy_reply = None
-                chunk_count = 0
-                while self._running:
-                    async for message in websocket:
-                        if regy_reply is None:
-                            regy_reply = message
-                            continue
-                        event_dict = json.loads(message)
-                        event = event_from_dict(event_dict)
-
-                        # Skip emitting events when paused, but keep receiving
-                        # to maintain the connection
-                        if self._paused:
-                            continue
-
-                        if "Audio" in event_dict['event_class']:
-                            if isinstance(event, AudioChunkEvent):
-                                if chunk_count % 1000 == 0:
-                                    logger.debug(event)
-                                chunk_count += 1
-                            else:
-                                logger.debug(event)
-                            await self.emit_event(event)
-                        elif "TextEvent" in event_dict['event_class']:
-                            logger.debug(event)
-                            await self._text_emitter.emit(TextEvent, event)
-                        elif "Draft" in event_dict['event_class']:
-                            logger.debug(event)
-                            await self._draft_emitter.emit(DraftEvent, event)
+                    events += text_event_names + draft_event_names
+                self._wanted = frozenset(events)
+                subscription = {"subscribe": events, "protocol": EVENT_PROTOCOL_VERSION}
+                await websocket.send(orjson.dumps(subscription).decode())
+                # EventRouter sends no reply to the subscription, every
+                # message from here on is an event. The loop ends when the
+                # connection closes, from either end.
+                async for message in websocket:
+                    await self._event_queue.put(message)
 
         except websockets.exceptions.ConnectionClosed:
             logger.info("Connection closed by server")
@@ -170,6 +168,63 @@ class NetListener(AudioListenerCCSMixin, AudioListener):
         finally:
             self._websocket = None
             self._reader_task = None
+        # let the dispatcher finish what is queued and then stop, rather than
+        # leave it waiting on a queue nothing will ever fill again
+        await self._event_queue.put(_READER_DONE)
+
+    async def _dispatcher(self):
+        # this gets wraped with get_error_handler so let the errors fly
+        handlers = self._group_handlers
+        while True:
+            # wait for one message, then take whatever else arrived in the
+            # meantime so a burst gets handled without a wakeup per message
+            batch = [await self._event_queue.get()]
+            while not self._event_queue.empty():
+                batch.append(self._event_queue.get_nowait())
+            for message in batch:
+                if message is _READER_DONE:
+                    logger.info("Event stream ended, NetListener stopping")
+                    self._running = False
+                    self._dispatch_task = None
+                    return
+                event_dict = orjson.loads(message)
+                seq = event_dict.get('seq')
+                if seq is not None:
+                    if self._next_seq is not None and seq != self._next_seq:
+                        await self.on_gap(self._next_seq, seq)
+                    self._next_seq = seq + 1
+
+                # Skip emitting events when paused, but keep receiving
+                # to maintain the connection. Check before building the
+                # event so skipped chunks never get their audio decoded.
+                if self._paused or event_dict['event_class'] not in self._wanted:
+                    continue
+
+                group, event = event_and_group_from_dict(event_dict)
+                await handlers[group](event)
+
+    async def on_gap(self, expected, got):
+        """ Called when the event stream skips sequence numbers, which means
+        the server dropped events before sending them."""
+        self.gaps += 1
+        logger.warning("Event stream gap, expected seq %d got %d", expected, got)
+
+    async def _dispatch_audio(self, event):
+        if isinstance(event, AudioChunkEvent):
+            if self._chunk_count % 1000 == 0:
+                logger.debug(event)
+            self._chunk_count += 1
+        else:
+            logger.debug(event)
+        await self.emit_event(event)
+
+    async def _dispatch_text(self, event):
+        logger.debug(event)
+        await self._text_emitter.emit(TextEvent, event)
+
+    async def _dispatch_draft(self, event):
+        logger.debug(event)
+        await self._draft_emitter.emit(DraftEvent, event)
 
     async def stop_streaming(self) -> None:
         if not self._running:
@@ -186,6 +241,13 @@ class NetListener(AudioListenerCCSMixin, AudioListener):
                 await self._reader_task
             except asyncio.CancelledError:
                 pass
+        if self._dispatch_task:
+            self._dispatch_task.cancel()
+            try:
+                await self._dispatch_task
+            except asyncio.CancelledError:
+                pass
+            self._dispatch_task = None
 
     # ------------------------------------------------------------------
     # Context manager support to ensure open files get closed
@@ -34,6 +34,9 @@ VAD_SR = 16000
 
 def downsample_to_512(chunk: np.ndarray, in_samplerate) -> np.ndarray:
     """Downsample to exactly 512 samples @ 16 kHz for VAD"""
+    if in_samplerate == VAD_SR and chunk.shape[0] == 512 and chunk.dtype == np.float32:
+        # the pipeline's DownSampler normally delivers this already, nothing to do
+        return chunk
     down = resample_poly(chunk, VAD_SR, in_samplerate)
     if down.shape[0] > 512:
         down = down[:512]
@@ -53,6 +56,12 @@ class VADFilter(AudioEventListener):
         self._threshold = 0.5
         self._speech_pad_ms = 1500
         self._vad = self.create_vad(self._silence_ms, self._threshold, self._speech_pad_ms)
+        # One 512 sample window per call is too small to gain anything from
+        # intra-op threads, and the thread handoff costs more than the model
+        # does. Note this is process wide torch state, set once here when the
+        # pipeline builds its VADFilter, so anything else running torch in
+        # the same process also gets one intra-op thread.
+        torch.set_num_threads(1)
         self._counter = None
         self._speech_start_time = None
         self._last_in_speech_chunk = None
@@ -69,7 +78,7 @@ class VADFilter(AudioEventListener):
         self._silence_ms = silence_ms
         self._threshold = threshold
         self._speech_pad_ms = speech_pad_ms
-        logger.info(f"Creating VAD: silence_threshold={silence_ms}ms, vad_threshold={threshold}")
+        logger.info("Creating VAD: silence_threshold=%sms, vad_threshold=%s", silence_ms, threshold)
         vad = VADIterator(
             _vad_model,
             threshold=self._threshold,
@@ -94,10 +103,14 @@ class VADFilter(AudioEventListener):
             event.in_speech = self._in_speech
             await self.emitter.emit(AudioEvent, event)
             return
-        chunk = event.data[:, 0].copy()
+        # a view, downsample_to_512 makes its own array if it has to change anything
+        chunk = event.data[:, 0]
         start_time = time.time()
-        vad_chunk = downsample_to_512(chunk, event.sample_rate)
-        window = self._vad(vad_chunk, return_seconds=False)
+        # wrap the samples rather than letting VADIterator copy them into a new torch.Tensor
+        vad_chunk = torch.from_numpy(np.ascontiguousarray(downsample_to_512(chunk, event.sample_rate)))
+        # no autograd bookkeeping, we only ever run the model forward
+        with torch.inference_mode():
+            window = self._vad(vad_chunk, return_seconds=False)
         self._counter = time.time() - start_time
         if window:
             if window.get("start") is not None:
@@ -1,10 +1,11 @@
 from typing import Any, Optional, ClassVar, Protocol
 from enum import StrEnum, auto
+import os
+import sys
 import time
 import uuid
-import inspect
 from dataclasses import dataclass, field, fields
-from collections import deque
+import bisect
 import numpy as np
 
 class AudioEventType(StrEnum):
@@ -15,9 +16,15 @@ class AudioEventType(StrEnum):
     audio_speech_start = auto()
     audio_speech_stop = auto()
 
+# Recording where each event was created costs a frame walk and a string
+# format per event, at chunk rate, so it is only done when debugging.
+_DEBUG_LOCATIONS = os.environ.get("PALAVER_EVENT_LOC") == "1"
+
 def get_creation_location():
+    if not _DEBUG_LOCATIONS:
+        return None
     # Get the frame two levels up: skip the factory func and dataclass __init__
-    frame = inspect.currentframe().f_back.f_back
+    frame = sys._getframe(2)
     filename = frame.f_code.co_filename
     lineno = frame.f_lineno
     return f"{filename}:{lineno}"
@@ -34,7 +41,7 @@ class AudioEvent:
     speech_start_time: Optional[float] = None
     timestamp: float = field(default_factory=time.time)
     event_id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    creation_location: str = field(default_factory=get_creation_location, repr=True)
+    creation_location: Optional[str] = field(default_factory=get_creation_location, repr=True)
     author_uri: Optional[str] = None  # Source server/service URI (Story 007)
 
 @dataclass(kw_only=True)
@@ -103,7 +110,14 @@ class AudioRingBuffer:
         if max_seconds <= 0:
             raise ValueError("max_seconds must be positive")
         self.max_seconds = max_seconds
-        self.buffer: deque[AudioEvent] = deque()
+        # Events arrive in time order, so these lists stay sorted by timestamp
+        # and get_from can bisect instead of scanning.
+        self.buffer: list[AudioEvent] = []
+        self._timestamps: list[float] = []
+        # expiry time of each buffered event, precomputed on add so pruning
+        # is a single float compare per event. Timestamps are wall clock
+        # (or simulated wall clock for file input), so no monotonic clock here.
+        self._expires: list[float] = []
 
     def has_data(self):
         return len(self.buffer)
@@ -113,6 +127,8 @@ class AudioRingBuffer:
         Add a new AudioEvent to the buffer and prune old entries.
         """
         self.buffer.append(event)
+        self._timestamps.append(event.timestamp)
+        self._expires.append(event.timestamp + event.duration + self.max_seconds)
         self._prune()
 
     def _prune(self, now: float = None) -> None:
@@ -123,25 +139,31 @@ class AudioRingBuffer:
         """
         if now is None:
             now = time.time()
-        while self.buffer and (self.buffer[0].timestamp + self.buffer[0].duration < now - self.max_seconds):
-            self.buffer.popleft()
+        expires = self._expires
+        count = 0
+        limit = len(expires)
+        while count < limit and expires[count] < now:
+            count += 1
+        if count:
+            del self.buffer[:count]
+            del self._timestamps[:count]
+            del expires[:count]
 
     def get_all(self, clear=False) -> list[AudioEvent]:
         """Return a list of all current events in the buffer (oldest to newest)."""
         res = list(self.buffer)
         if clear:
-            self.buffer.clear()
+            self.clear()
         return res
 
     def clear(self):
         self.buffer.clear()
+        self._timestamps.clear()
+        self._expires.clear()
         
     def get_from(self, start_time) -> list[AudioEvent]:
-        """Return a list of all current events in the buffer (oldest to newest)."""
-        res = []
-        for item in self.buffer:
-            if item.timestamp >= start_time:
-                res.append(item)
-        return res
+        """Return a list of current events with timestamp at or after start_time (oldest to newest)."""
+        index = bisect.bisect_left(self._timestamps, start_time)
+        return self.buffer[index:]
 
     
@@ -1,8 +1,7 @@
 import asyncio
 import logging
-import uuid
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Optional, Callable
 from pathlib import Path
 import traceback
@@ -190,7 +189,7 @@ class ScribePipeline:
                         await asyncio.sleep(0.01)
                         busy = self.whisper_tool.sound_pending()
                     if busy:
-                        logger.error(f"Whisper failed to complete pending audio in {max_wait} seconds")
+                        logger.error("Whisper failed to complete pending audio in %s seconds", max_wait)
                         raise Exception(f"Whisper failed to complete pending audio in {max_wait} seconds")
                     await asyncio.sleep(0.1)
                     print(f'\n!!!!!!!!!!!!!!!!!!!! {time.time()}: Starting shutdown !!!!!!!!!!!!!!!!!!!\n')
@@ -250,7 +249,6 @@ class ScribePipeline:
 @dataclass
 class BlockTracker:
     start_event: DraftStartEvent
-    text_events: dict[uuid, TextEvent] = field(default_factory=dict[uuid, TextEvent])
     end_event: Optional[DraftEndEvent] = None
     finalized: Optional[bool] = False
 
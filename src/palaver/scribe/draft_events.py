@@ -6,7 +6,7 @@ import time
 import uuid
 
 
-@dataclass
+@dataclass(slots=True)
 class Draft:
     start_text: str
     end_text: Optional[str] = None
@@ -1,13 +1,14 @@
 import asyncio
 import logging
-import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, field, asdict, fields
 from typing import Optional
 
 import numpy as np
+import orjson
 import soundfile as sf
 from sqlmodel import SQLModel, Field, create_engine, Session, Relationship
 from palaver.scribe.audio_events import AudioEvent, AudioChunkEvent, AudioRingBuffer
@@ -76,7 +77,7 @@ class DraftRecord(SQLModel, table=True):
         session.commit()
         session.refresh(draft_record)
 
-        logger.info(f"Created draft {draft_record.id} with parent UUID {parent_draft_uuid}")
+        logger.info("Created draft %s with parent UUID %s", draft_record.id, parent_draft_uuid)
         return draft_record
 
     @classmethod
@@ -146,12 +147,16 @@ class SQLDraftRecorder(ScribeAPIListener):
         self._current_draft = None
         self._chunk_ring = AudioRingBuffer(max_seconds=chunk_ring_seconds)
         self._wav_file = None
+        # WAV writes go to a single worker so they stay in order but keep
+        # disk I/O off the event loop
+        self._wav_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="draft_wav")
 
     async def on_pipeline_ready(self, pipeline):
         pass
 
     async def on_pipeline_shutdown(self):
         await self._close()
+        self._wav_pool.shutdown(wait=True)
 
     async def on_audio_event(self, event: AudioEvent):
         if not self._current_draft:
@@ -167,9 +172,10 @@ class SQLDraftRecorder(ScribeAPIListener):
             return
 
         async def write_from_event(event):
-            data_to_write = np.concatenate(event.data)
-            logger.debug("Saving  %d samples to wav file", len(data_to_write))
-            self._wav_file.write(data_to_write)
+            # chunk data is already (frames, channels), which is what SoundFile wants
+            logger.debug("Saving  %d samples to wav file", len(event.data))
+            future = self._wav_pool.submit(self._wav_file.write, event.data)
+            future.add_done_callback(self._wav_write_done)
 
         if self._wav_file is None:
             await self._open_wav_file(event)
@@ -179,6 +185,10 @@ class SQLDraftRecorder(ScribeAPIListener):
                 self._chunk_ring.clear()
         await write_from_event(event)
 
+    def _wav_write_done(self, future):
+        if future.exception() is not None:
+            logger.error("Error writing draft wav file: %s", future.exception())
+
     async def _open_wav_file(self, event: AudioChunkEvent):
         if isinstance(event.channels, tuple):
             channels = event.channels[1]
@@ -195,7 +205,8 @@ class SQLDraftRecorder(ScribeAPIListener):
         leading_seconds = 0.4
         leading_frames = int(samplerate * leading_seconds)
         silence_block = np.zeros((leading_frames, channels), dtype=np.float32)
-        self._wav_file.write(silence_block)
+        future = self._wav_pool.submit(self._wav_file.write, silence_block)
+        future.add_done_callback(self._wav_write_done)
 
     async def on_draft_event(self, event: DraftEvent):
         if isinstance(event, DraftStartEvent) or isinstance(event, DraftEndEvent):
@@ -254,57 +265,60 @@ class SQLDraftRecorder(ScribeAPIListener):
             )
             session.add(draft_record)
             session.commit()
-            logger.info(f"Saved draft {draft_record.id} to database")
+            logger.info("Saved draft %s to database", draft_record.id)
         
     async def on_text_event(self, event: TextEvent):
         pass
 
     async def _close(self):
+        # Detach everything first. Audio events can run while we wait on
+        # the pool below, and they must neither write to the file being
+        # closed nor see a draft without a file and open a new one. With
+        # no current draft their chunks just go to the ring.
+        wav_file, self._wav_file = self._wav_file, None
+        draft, self._current_draft = self._current_draft, None
+        current_dir, self._current_dir = self._current_dir, None
+
         # Close WAV file if it exists
-        if self._wav_file:
-            self._wav_file.close()
-            self._wav_file = None
+        if wav_file:
+            # queued behind any pending writes, so waiting on it waits for those too
+            await asyncio.wrap_future(self._wav_pool.submit(wav_file.close))
 
         # Save draft data
-        if self._current_draft:
+        if draft:
             # Save files only if file storage is enabled and directory exists
-            if self._enable_file_storage and self._current_dir:
+            if self._enable_file_storage and current_dir:
                 # Save text file (for easy reading)
-                text_path = self._current_dir / "first_draft.txt"
+                text_path = current_dir / "first_draft.txt"
                 with open(text_path, 'w') as f:
-                    f.write(self._current_draft.full_text)
+                    f.write(draft.full_text)
 
                 # Save JSON file (for compatibility)
-                json_draft_path = self._current_dir / "first_draft.json"
+                json_draft_path = current_dir / "first_draft.json"
                 json_draft = {
-                    'classname': str(self._current_draft.__class__),
-                    'properties': asdict(self._current_draft)
+                    'classname': str(draft.__class__),
+                    'properties': asdict(draft)
                 }
-                with open(json_draft_path, 'w') as f:
-                    json.dump(json_draft, f, indent=2)
+                json_draft_path.write_bytes(orjson.dumps(json_draft, option=orjson.OPT_INDENT_2))
 
             # Save to database
-            await self._save_to_database()
-
-            self._current_draft = None
-
-        self._current_dir = None
+            await self._save_to_database(draft, current_dir)
 
-    async def _save_to_database(self):
+    async def _save_to_database(self, draft: Draft, current_dir: Optional[Path]):
         """Save draft to SQLite database"""
         with Session(self._engine) as session:
             # Create draft record
             # directory_path will be empty string if file storage disabled
             draft_record = DraftRecord(
-                draft_id=str(self._current_draft.draft_id),
-                timestamp=self._current_draft.timestamp,
-                full_text=self._current_draft.full_text,
-                classname=str(self._current_draft.__class__),
-                directory_path=str(self._current_dir) if self._current_dir else ""
+                draft_id=str(draft.draft_id),
+                timestamp=draft.timestamp,
+                full_text=draft.full_text,
+                classname=str(draft.__class__),
+                directory_path=str(current_dir) if current_dir else ""
             )
             session.add(draft_record)
             session.commit()
-            logger.info(f"Saved draft {draft_record.id} to database")
+            logger.info("Saved draft %s to database", draft_record.id)
 
     def get_all_drafts(self) -> list[DraftRecord]:
         """Query all drafts from database"""
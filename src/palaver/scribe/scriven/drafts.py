@@ -6,13 +6,15 @@ import string
 from typing import Optional, List
 from dataclasses import dataclass, field
 from pathlib import Path
+from collections import Counter
 from enum import Enum
 import time
 import uuid
 from pprint import pformat
 
+import numpy as np
 from eventemitter import AsyncIOEventEmitter
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 from palaver.utils.top_error import get_error_handler
 from palaver.scribe.audio_events import AudioEvent, AudioStopEvent, AudioEventListener
 from palaver.scribe.text_events import TextEvent, TextEventListener
@@ -26,11 +28,56 @@ from palaver.scribe.draft_events import (DraftEvent,
 logger = logging.getLogger('DraftMaker')
 
 
+PUNCTUATION_REMOVER = str.maketrans("", "", string.punctuation)
+# True for every byte value that survives cleaning
+KEEP_BYTE = np.ones(256, dtype=bool)
+KEEP_BYTE[np.frombuffer(string.punctuation.encode('ascii'), dtype=np.uint8)] = False
+PUNCTUATION_SET = frozenset(string.punctuation)
+
+def clean_text_with_mapping(text: str) -> tuple[str, np.ndarray]:
+    """
+    Clean text (lowercase + strip punctuation) and return cleaned string + int32 array of original indices for each kept char.
+    """
+    try:
+        raw = text.encode('latin-1')
+    except UnicodeEncodeError:
+        raw = None
+    if raw is not None:
+        # one char per byte, and lowercasing a latin-1 char always gives
+        # exactly one latin-1 char and never changes punctuation, so this
+        # can all be done in C
+        keep = KEEP_BYTE[np.frombuffer(raw, dtype=np.uint8)]
+        return text.lower().translate(PUNCTUATION_REMOVER), np.flatnonzero(keep).astype(np.int32)
+    cleaned = []
+    mapping = []  # Original positions for each char in cleaned
+    for i, char in enumerate(text):
+        lower_char = char.lower()
+        if lower_char not in PUNCTUATION_SET:  # Keep non-punct (after lower)
+            cleaned.append(lower_char)
+            mapping.append(i)  # Record original index
+    return "".join(cleaned), np.array(mapping, dtype=np.int32)
+
+
 @dataclass
 class MatchPattern:
     pattern: str
     required_words: Optional[list[str]] = field(default_factory=list[str])
+    # cleaned forms of the above, patterns don't change so match_first
+    # can use these rather than cleaning them on every call
+    cleaned_pattern: str = field(init=False, repr=False, compare=False)
+    cleaned_required: list[str] = field(init=False, repr=False, compare=False)
+    char_counts: dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.cleaned_pattern = clean_text_with_mapping(self.pattern)[0]
+        self.char_counts = dict(Counter(self.cleaned_pattern))
+        self.cleaned_required = [clean_text_with_mapping(word)[0]
+                                 for word in self.required_words or []]
     
+class PatternKind(Enum):
+    draft_start = "draft_start"
+    draft_end = "draft_end"
+
 @dataclass
 class MatchResult:
     match_pattern: MatchPattern
@@ -86,61 +133,91 @@ default_draft_end_patterns.append(pat)
                 
 
     
-PUNCTUATION_REMOVER = str.maketrans("", "", string.punctuation)
-
-def clean_text_with_mapping(text: str) -> tuple[str, list[int]]:
+def match_first(patterns: list[MatchPattern], text: str, ratio_min: float = 85.0,
+                cleaned: Optional[tuple[str, np.ndarray]] = None) -> list[MatchResult]:
     """
-    Clean text (lowercase + strip punctuation) and return cleaned string + list of original indices for each kept char.
+    Find the best pattern match in text. If the caller already has the output of
+    clean_text_with_mapping for text it can pass it as cleaned to skip that step.
     """
-    cleaned = []
-    mapping = []  # Original positions for each char in cleaned
-    for i, char in enumerate(text):
-        lower_char = char.lower()
-        if lower_char not in string.punctuation:  # Keep non-punct (after lower)
-            cleaned.append(lower_char)
-            mapping.append(i)  # Record original index
-    return "".join(cleaned), mapping
-
-def match_first(patterns: list[MatchPattern], text: str, ratio_min: float = 85.0) -> list[MatchResult]:
     results = []
-    cleaned_text, text_mapping = clean_text_with_mapping(text)
+    if cleaned is None:
+        cleaned = clean_text_with_mapping(text)
+    cleaned_text, text_mapping = cleaned
+    tokens = cleaned_text.split()
+    text_chars = set(cleaned_text)
+    word_found = {}
+    candidates = []
     for pattern_spec in patterns:
 
+        # every window is as long as the pattern, so a pattern longer
+        # than the text has none
+        pat_len = len(pattern_spec.cleaned_pattern)
+        if pat_len > len(cleaned_text):
+            continue
+
+        # Quick reject on characters alone. If m of the pattern's L chars
+        # don't appear anywhere in the text, no alignment can do better
+        # than 2(L-m)/(2L-m), so skip the pattern if that is under ratio_min
+        missing = sum(n for c, n in pattern_spec.char_counts.items() if c not in text_chars)
+        if missing and 100 * 2 * (pat_len - missing) < ratio_min * (2 * pat_len - missing):
+            continue
+
         # if there are any required words, make sure they are present first
-        if len(pattern_spec.required_words) > 0:
+        if len(pattern_spec.cleaned_required) > 0:
             any_failed = False
-            for word in pattern_spec.required_words:
-                best_score = 0
-                for subw in cleaned_text.split():
-                    score = fuzz.ratio(word, subw)
-                    best_score = max(score, best_score)
-                    if score >= 90:
-                        break
-                if best_score < 90:
-                    #logger.debug("%s required word '%s' low score %f in %s",
-                    #             pattern_spec.pattern, word, best_score, cleaned_text)
+            for word in pattern_spec.cleaned_required:
+                # most patterns share their required words, so only look
+                # each one up once per call
+                found = word_found.get(word)
+                if found is None:
+                    hit = process.extractOne(word, tokens, scorer=fuzz.ratio, score_cutoff=90)
+                    found = word_found[word] = hit is not None
+                if not found:
+                    #logger.debug("%s required word '%s' not found in %s",
+                    #             pattern_spec.pattern, word, cleaned_text)
                     any_failed = True
                     break
             if any_failed:
                 continue
-
-        # Sliding window: Check substrings roughly pattern length + fuzz room
-        cleaned_pattern, _ = clean_text_with_mapping(pattern_spec.pattern)
-        pat_len = len(cleaned_pattern)
+        candidates.append(pattern_spec)
+
+    # Sliding window: Check substrings roughly pattern length + fuzz room.
+    # Patterns with the same length share the same windows, so each length
+    # gets its windows built once and all of its patterns scored against
+    # them in one batch call
+    by_len = {}
+    for index, pattern_spec in enumerate(candidates):
+        by_len.setdefault(len(pattern_spec.cleaned_pattern), []).append(index)
+    all_windows = {}
+    all_scores = [None] * len(candidates)
+    for pat_len, indexes in by_len.items():
+        windows = [cleaned_text[start:start + pat_len]
+                   for start in range(len(cleaned_text) - pat_len + 1)]
+        all_windows[pat_len] = windows
+        scores = process.cdist([candidates[i].cleaned_pattern for i in indexes], windows,
+                               scorer=fuzz.partial_ratio, score_cutoff=ratio_min)
+        for index, row in zip(indexes, scores):
+            all_scores[index] = row
+
+    for pattern_spec, scores in zip(candidates, all_scores):
+        cleaned_pattern = pattern_spec.cleaned_pattern
+        windows = all_windows[len(cleaned_pattern)]
         best_results = []  # Collect all above threshold for this pattern
-        for start in range(len(cleaned_text) - pat_len + 1):
-            end = start + pat_len
-            if end > len(cleaned_text):
-                end = len(cleaned_text)
-            sub = cleaned_text[start:end]
-            alignment = fuzz.partial_ratio_alignment(cleaned_pattern, sub)
-            if alignment.score >= ratio_min:
+        # Only the windows tied for the top score can be chosen below,
+        # so those are the only ones that need the alignment computed
+        top_windows = []
+        if len(scores) and scores.max() >= ratio_min:
+            top_windows = np.flatnonzero(scores == scores.max()).tolist()
+        for start in top_windows:
+            sub = windows[start]
+            alignment = fuzz.partial_ratio_alignment(cleaned_pattern, sub, score_cutoff=ratio_min)
+            if alignment is not None:
                 # now check for required words if any
                 # Alignment indices are relative to sub; adjust to full cleaned_text
                 abs_start = start + alignment.dest_start
                 abs_end = start + alignment.dest_end
-                orig_start = text_mapping[abs_start] if abs_start < len(text_mapping) else len(text)
-                orig_end = text_mapping[abs_end - 1] + 1 if abs_end > 0 else len(text)
+                orig_start = int(text_mapping[abs_start]) if abs_start < len(text_mapping) else len(text)
+                orig_end = int(text_mapping[abs_end - 1]) + 1 if abs_end > 0 else len(text)
                 matched_string = text[orig_start:orig_end]
                 result = MatchResult(
                     match_pattern=pattern_spec,
@@ -211,10 +288,19 @@ class DraftBuilder:
         self.search_text_events = [] # the text events that built the search text
         self.draft_start_patterns = []
         self.draft_end_patterns = []
+        # both lists combined, in the two search orders new_text_event_op uses
+        self.start_first_patterns = []
+        self.end_first_patterns = []
+        self.min_pattern_len = 0 # shortest cleaned pattern
+        # id(pattern) -> PatternKind, so a match can be classified without
+        # searching the pattern lists
+        self.pattern_kinds = {}
         self.current_draft = None
         self.job_queue = asyncio.Queue()
         self.result_queue = asyncio.Queue()
         self.text_event_map = []  # [(TextEvent, start_pos_in_buffer, end_pos_in_buffer), ...]
+        # search_text as last cleaned, with its cleaned form and index mapping
+        self._cleaned_cache = ("", "", np.empty(0, dtype=np.int32))
         if load_defaults:
             for sp in default_draft_start_patterns:
                 self.add_draft_start_pattern(sp)
@@ -223,10 +309,19 @@ class DraftBuilder:
 
     def add_draft_start_pattern(self, pattern: MatchPattern):
         self.draft_start_patterns.append(pattern)
+        self.pattern_kinds[id(pattern)] = PatternKind.draft_start
+        self._combine_patterns()
         self.runner_task = get_error_handler().wrap_task(self.job_runner)
 
     def add_draft_end_pattern(self, pattern: MatchPattern):
         self.draft_end_patterns.append(pattern)
+        self.pattern_kinds[id(pattern)] = PatternKind.draft_end
+        self._combine_patterns()
+
+    def _combine_patterns(self):
+        self.start_first_patterns = self.draft_start_patterns + self.draft_end_patterns
+        self.end_first_patterns = self.draft_end_patterns + self.draft_start_patterns
+        self.min_pattern_len = min(len(p.cleaned_pattern) for p in self.start_first_patterns)
 
     async def _cleanup_old_text_event(self, target_tei: TextEventIndex):
         """Background task to clean up old text events after 20 seconds if no draft started.
@@ -251,7 +346,7 @@ class DraftBuilder:
 
         # Log what we're removing
         removed_count = target_index + 1
-        logger.info(f"Cleaning up {removed_count} old text event(s) (>20s without draft)")
+        logger.info("Cleaning up %d old text event(s) (>20s without draft)", removed_count)
 
         # Remove all events up to and including the target
         self.search_text_events = self.search_text_events[target_index + 1:]
@@ -260,15 +355,42 @@ class DraftBuilder:
         self.search_text = ""
         for tei in self.search_text_events:
             start_pos = len(self.search_text)
+            sep = ''
             if start_pos > 0 and not self.search_text[-1].isspace() and not tei.text_event.text[0].isspace():
-                self.search_text += ' '
-            self.search_text += tei.text_event.text
+                sep = ' '
+            self.search_text += sep + tei.text_event.text
             end_pos = len(self.search_text)
             # Update the positions in the TextEventIndex
             tei.start_pos = start_pos
             tei.end_pos = end_pos
 
-        logger.debug(f"After cleanup: search_text now has {len(self.search_text_events)} events, {len(self.search_text)} chars")
+        logger.debug("After cleanup: search_text now has %d events, %d chars",
+                     len(self.search_text_events), len(self.search_text))
+
+    def _cleaned_search_text(self) -> tuple[str, np.ndarray]:
+        """
+        Return clean_text_with_mapping(self.search_text), only cleaning what changed
+        since the last call. The search text usually grows at the end, or gets
+        trimmed from the front after a match.
+        """
+        text = self.search_text
+        old_text, cleaned, mapping = self._cleaned_cache
+        if text == old_text:
+            return cleaned, mapping
+        if old_text and text.startswith(old_text):
+            offset = len(old_text)
+            more_cleaned, more_mapping = clean_text_with_mapping(text[offset:])
+            cleaned = cleaned + more_cleaned
+            mapping = np.concatenate((mapping, more_mapping + offset))
+        elif text and old_text.endswith(text):
+            offset = len(old_text) - len(text)
+            keep = int(np.searchsorted(mapping, offset))
+            cleaned = cleaned[keep:]
+            mapping = mapping[keep:] - offset
+        else:
+            cleaned, mapping = clean_text_with_mapping(text)
+        self._cleaned_cache = (text, cleaned, mapping)
+        return cleaned, mapping
 
     async def job_runner(self):
         try:
@@ -292,10 +414,12 @@ class DraftBuilder:
     
     async def new_text_event_op(self,  text_event):
         start_pos = len(self.search_text)
+        sep = ''
         if start_pos > 0 and not self.search_text[-1].isspace() and not text_event.text[0].isspace():
-            self.search_text += ' '
+            sep = ' '
         logger.debug("Adding text '%s' to search '%s'", text_event.text, self.search_text)
-        self.search_text += text_event.text
+        # one copy of the (possibly long) search text, not one per piece
+        self.search_text += sep + text_event.text
         end_pos = len(self.search_text)
         tei = TextEventIndex(text_event, start_pos, end_pos)
         self.search_text_events.append(tei)
@@ -306,21 +430,28 @@ class DraftBuilder:
             get_error_handler().wrap_task(lambda: self._cleanup_old_text_event(tei))
             logger.debug("Created cleanup task for text event (will expire in 20s if no draft)")
 
+        # nothing can match until some patterns are added, or while the
+        # text is shorter than every pattern (cleaning only shortens it)
+        if not self.start_first_patterns or len(self.search_text) < self.min_pattern_len:
+            return []
+
         # make the search a little more efficient by ordering the match patterns
         if self.current_draft:
-            patterns =  self.draft_end_patterns + self.draft_start_patterns 
+            patterns = self.end_first_patterns
         else:
-            patterns = self.draft_start_patterns + self.draft_end_patterns 
+            patterns = self.start_first_patterns
 
         last_draft = self.current_draft
         drafts = []
-        matched = match_first(patterns, self.search_text)
+        matched = match_first(patterns, self.search_text,
+                              cleaned=self._cleaned_search_text())
         if not matched:
             logger.debug("No match triggered by '%s', on search_text '%s'",
                                 text_event.text, self.search_text)
             return []
 
         while matched:
+            kind = self.pattern_kinds[id(matched.match_pattern)]
             # figure out where it is in the search string, really
             actual_start, actual_end = self.find_real_range(matched)
             logger.debug('-'*80)
@@ -396,12 +527,12 @@ class DraftBuilder:
                 self.current_draft = None
                 self.search_text_events = remaining_teis
                 self.search_text = self.search_text[actual_end:]
-            elif matched.match_pattern in self.draft_end_patterns:
+            elif kind is PatternKind.draft_end:
                 # 2.b
                 self.search_text_events = remaining_teis
                 logger.info("Draft end signal '%s' detected when no draft current, ignoring",
                             matched.matched_text)
-            if matched.match_pattern in self.draft_start_patterns:
+            if kind is PatternKind.draft_start:
                 # 1.a and 2.a
                 # the positions aren't useful, legacy, but the text is
                 self.current_draft = Draft(start_text=matched.matched_text,
@@ -414,7 +545,8 @@ class DraftBuilder:
                 for tei in remaining_teis:
                     if tei not in use_teis:
                         self.search_text_events.append(tei)
-            matched = match_first(patterns, self.search_text)
+            matched = match_first(patterns, self.search_text,
+                                  cleaned=self._cleaned_search_text())
         return drafts
         
     def find_real_range(self, matched):
@@ -428,27 +560,29 @@ class DraftBuilder:
         adj_start = matched.match_start
         adj_end = matched.match_end 
         msplit = matched.matched_text.lower().rstrip().split(' ')
-        buff = self.search_text[adj_start:].lower()
-        index = buff.find(msplit[0])
+        # lowercase once and search from offsets, rather than lowercasing
+        # a fresh slice of the text for every word
+        lower_text = self.search_text.lower()
+        index = lower_text.find(msplit[0], adj_start)
         if index == -1:
             # the input text might have some extra spaces
             # before the match which will get stripped out
             # during match. Take a swing at it backing up some
             # to catch it. The number 5 is air pulled
             start = max(0, adj_start-5)
-            index = buff.find(msplit[0])
+            index = lower_text.find(msplit[0], start)
             if index == -1:
                 raise Exception(f"Can't find matched text '{matched.matched_text}' in '{self.search_text}'")
-        actual_start = adj_start + index
+        actual_start = index
         # This is a bit tricky. We use "break break" or "break break break" in
         # some end patterns, so we need to find each of the words in the match string, not
         # just the last one.
         cursor = actual_start
         for nw in msplit[1:]:
-            index = self.search_text[cursor:].lower().find(nw.lower())
+            index = lower_text.find(nw, cursor)
             if index == -1:
                 raise Exception(f"Can't find matched text '{matched.matched_text}' in '{self.search_text}'")
-            cursor += index + len(nw)
+            cursor = index + len(nw)
         actual_end = cursor
         # need to advance till space or end so that we capture punctuation at the end
         while actual_end < len(self.search_text) and not self.search_text[actual_end].isspace():
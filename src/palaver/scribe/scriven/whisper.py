@@ -1,6 +1,7 @@
 import os
 import time
 import logging
+import logging.handlers
 import asyncio
 import traceback
 from typing import Optional, Dict
@@ -9,7 +10,7 @@ from queue import Empty, Queue
 from dataclasses import dataclass, field
 from threading import Event as TEvent
 import multiprocessing as mp
-from multiprocessing import Process, Queue as MPQueue, Event as MPEvent
+from multiprocessing import Queue as MPQueue, Event as MPEvent
 import subprocess
 import numpy as np
 from pywhispercpp.model import Model
@@ -42,6 +43,21 @@ INITIAL_PROMPT = "Rupert, Freddy, Bubba, Babbage, draft, close, break"
 
 logger = logging.getLogger("WhisperWrapper")
 PRINTING = False
+
+# Start the worker process fresh rather than forking. Forking a parent that
+# already has torch's OpenMP thread pool and PortAudio running can leave the
+# child with locks held by threads that no longer exist. A spawned worker is
+# not any lighter, it re-imports the main script, so with the scripts as they
+# are it loads torch and the VAD as well, just never uses them.
+_mp_context = mp.get_context("spawn")
+
+
+class _ForwardToLogger(logging.Handler):
+    """ Hands records that came from the worker process to the parent's logger
+    of the same name, so they go through whatever handlers the app configured """
+
+    def emit(self, record):
+        logging.getLogger(record.name).handle(record)
 class ScriveJob:
 
     def __init__(self, job_id: int, data: np.ndarray, first_chunk: AudioChunkEvent, last_chunk:AudioChunkEvent, initial_prompt:str = None):
@@ -126,10 +142,18 @@ def thread_worker_wrapper(job_queue: Queue, result_queue: Queue,
 
 def process_worker_wrapper(job_queue: MPQueue, result_queue: MPQueue,
                            error_queue: MPQueue, shutdown_event: MPEvent,
-                           model_path: os.PathLike[str]):
+                           model_path: os.PathLike[str],
+                           log_queue: MPQueue = None, log_level: int = logging.INFO):
 
+    # A spawned process starts with no logging setup, so send records back to
+    # the parent over log_queue, where a QueueListener feeds them to its loggers.
+    # Formatting and output happen there, off the worker's transcription path.
+    if log_queue is not None:
+        root = logging.getLogger()
+        root.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+        root.setLevel(log_level)
     try:
-        logger.info(f"Worker process %d for model %s starting", os.getpid(), model_path)
+        logger.info("Worker process %d for model %s starting", os.getpid(), model_path)
         worker = Worker(job_queue, result_queue, shutdown_event, model_path)
         worker.run()
     except Exception as e:
@@ -138,7 +162,7 @@ def process_worker_wrapper(job_queue: MPQueue, result_queue: MPQueue,
         logger.error("Whipser thread exiting on error: \n%s", e)
         error_queue.put_nowait(error_dict)
         return error_dict
-    logger.info(f"Worker process %i for model %s exiting", os.getpid(), model_path)
+    logger.info("Worker process %i for model %s exiting", os.getpid(), model_path)
     return None
 
 BUFFER_SAMPLES = 5 * 16000  
@@ -163,10 +187,11 @@ class WhisperWrapper:
         self._initial_prompt = INITIAL_PROMPT
         self._use_mp = use_mp
         if self._use_mp:
-            self._job_queue = MPQueue()
-            self._result_queue = MPQueue()
-            self._error_queue = MPQueue()
-            self._shutdown_event = MPEvent()
+            self._job_queue = _mp_context.Queue()
+            self._result_queue = _mp_context.Queue()
+            self._error_queue = _mp_context.Queue()
+            self._shutdown_event = _mp_context.Event()
+            self._log_queue = _mp_context.Queue()
         else:
             self._job_queue = Queue()
             self._result_queue = Queue()
@@ -177,6 +202,7 @@ class WhisperWrapper:
         self._sender_task = None
         self._error_task = None
         self._audio_stop_event = None
+        self._log_listener = None
         self._emitter = AsyncIOEventEmitter()
 
     def set_initial_prompt(self, prompt):
@@ -227,9 +253,13 @@ class WhisperWrapper:
                     self._error_queue,
                     self._shutdown_event,
                     self._model_path,
+                    self._log_queue,
+                    logger.getEffectiveLevel(),
                     ]
+            self._log_listener = logging.handlers.QueueListener(self._log_queue, _ForwardToLogger())
+            self._log_listener.start()
             logger.info("Using process")
-            self._process = Process(target=process_worker_wrapper, args=args)
+            self._process = _mp_context.Process(target=process_worker_wrapper, args=args)
             self._process.start()
             self._worker_running = True
         else:
@@ -311,7 +341,7 @@ class WhisperWrapper:
             self._first_chunk = event
         self._last_chunk = event
         # event.data is already np.ndarray, shape (N, 1), dtype=float32, 16kHz mono
-        chunk = event.data.flatten()                # → shape (N,), makes life easier
+        chunk = event.data.ravel()                  # → shape (N,), a view for contiguous data
         samples_needed = self._buffer_samples - self._buffer_pos
         if len(chunk) <= samples_needed:
             # Whole chunk fits → just copy it in
@@ -365,6 +395,9 @@ class WhisperWrapper:
             if self._process:
                 self._process.join()
                 self._process = None
+            if self._log_listener:
+                self._log_listener.stop()
+                self._log_listener = None
         else:
             res = await self._worker_task
             if res:
@@ -387,12 +420,12 @@ class WhisperWrapper:
             return
         size = self._buffer_pos
         self._job_id_counter += 1
+        # the buffer gets reused, so the job needs its own copy of the samples
         job =  ScriveJob(job_id=self._job_id_counter,
-                         data=np.zeros(size, dtype=np.float32),
+                         data=self._buffer[:size].copy(),
                          first_chunk = self._first_chunk,
                          last_chunk = self._last_chunk,
                          initial_prompt=self._initial_prompt)
-        job.data[:] = self._buffer[:size]
         self._buffer_pos = 0
         self._first_chunk = None
         self._last_chunk = None
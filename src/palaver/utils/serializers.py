@@ -1,4 +1,5 @@
-from typing import Any
+from typing import Any, Optional
+import base64
 import numpy as np
 
 from palaver.scribe.audio_events import (
@@ -43,27 +44,64 @@ for etype in [AudioStartEvent,
               DraftEndEvent,
               ]:
     event_type_map[str(etype)] = etype
-    
+
+# Wire protocol versions for the /events stream. Version 1 sends ndarray
+# data as a json list of floats, version 2 as base64 encoded raw bytes
+# with the dtype and shape.
+# Clients ask for version 2 with a "protocol" key in their subscription.
+EVENT_PROTOCOL_V1 = 1
+EVENT_PROTOCOL_V2 = 2
+EVENT_PROTOCOL_VERSION = EVENT_PROTOCOL_V2
+
+# event_class strings as used in /events subscriptions, computed once here
+audio_event_names = tuple(str(etype) for etype in event_type_groups['audio'])
+text_event_names = tuple(str(etype) for etype in event_type_groups['text'])
+draft_event_names = tuple(str(etype) for etype in event_type_groups['draft'])
+all_event_names = frozenset(audio_event_names + text_event_names + draft_event_names)
+all_but_chunks_event_names = all_event_names - {str(AudioChunkEvent)}
+
+# event_class string -> (group, class), so decoding is one dict lookup
+# instead of scanning the group lists for every event
+_event_dispatch = {}
+for group, etypes in event_type_groups.items():
+    for etype in etypes:
+        _event_dispatch[str(etype)] = (group, etype)
 
     
 def event_from_dict(event_dict: dict) -> [AudioEvent | TextEvent | DraftEvent]:
-    event_class = event_type_map[event_dict['event_class']]
-    kwargs = dict(event_dict) # shallow
-    del kwargs['event_class']
-    if event_class in event_type_groups['audio']:
-        aet = AudioEventType(kwargs['event_type'])
+    """ Rebuild an event from serialize_event output, consumes event_dict."""
+    return event_and_group_from_dict(event_dict)[1]
+
+def event_and_group_from_dict(event_dict: dict) -> tuple[str, AudioEvent | TextEvent | DraftEvent]:
+    """ Like event_from_dict, but also returns the event's group name from event_type_groups,
+    so callers can dispatch on it without type checks.
+
+    The dict is consumed, its non field keys get popped and its values reused,
+    so callers should not use it afterwards."""
+    kwargs = event_dict
+    group, event_class = _event_dispatch[kwargs.pop('event_class')]
+    # stream sequence number added by EventRouter, not an event field
+    kwargs.pop('seq', None)
+    if group == 'audio':
         del kwargs['event_type']
         if "data" in kwargs:
-            kwargs["data"] = np.array(kwargs["data"], dtype=np.float32)  
-        return event_class(**kwargs)
-    if event_class in event_type_groups['text']:
-        return event_class(**kwargs)
-    if event_class in event_type_groups['draft']:
+            kwargs["data"] = ndarray_from_value(kwargs["data"])
+    elif group == 'draft':
         draft = draft_from_dict(kwargs['draft'])
         kwargs['draft'] = draft
-        return event_class(**kwargs)
+    return group, event_class(**kwargs)
         
 
+def ndarray_from_value(value) -> np.ndarray:
+    if isinstance(value, dict):
+        # protocol 2 form, see serialize_value
+        dtype = np.dtype(value.get('dtype', np.float32))
+        data = np.frombuffer(base64.b64decode(value['__ndarray__']), dtype=dtype)
+        # frombuffer gives a read only view in the sender's dtype, consumers
+        # expect the same writable float32 array that protocol 1 produces
+        return data.reshape(value['shape']).astype(np.float32)
+    return np.array(value, dtype=np.float32)
+
 def draft_from_dict(in_dict: dict) -> [DraftEvent]:
     return Draft(**in_dict)
 
@@ -90,7 +128,11 @@ def draft_record_to_dict(record) -> dict:
         "created_at": record.created_at.isoformat() if record.created_at else None,
     }
 
-def serialize_event(event: [AudioEvent | TextEvent | DraftEvent]) -> dict[str, Any]:
+def serialize_event(event: [AudioEvent | TextEvent | DraftEvent],
+                    protocol: int = EVENT_PROTOCOL_V1) -> dict[str, Any]:
+    serializer = _event_serializers.get(event.__class__)
+    if serializer is not None:
+        return serializer(event, protocol)
     event_class = str(event.__class__)
     event_dict = {"event_class": event_class}
 
@@ -98,15 +140,46 @@ def serialize_event(event: [AudioEvent | TextEvent | DraftEvent]) -> dict[str, A
     if hasattr(event, "__dataclass_fields__"):
         for field_name in event.__dataclass_fields__:
             value = getattr(event, field_name)
-            event_dict[field_name] = serialize_value(value, field_name)
+            event_dict[field_name] = serialize_value(value, field_name, protocol)
 
     return event_dict
 
-def serialize_value(value: Any, field_name: str = None) -> Any:
+# Field types that serialize_value would return unchanged
+_plain_field_types = (str, int, float, bool,
+                      Optional[str], Optional[int], Optional[float], Optional[bool])
+
+def _make_event_serializer(event_class):
+    """ Build a serialize_event equivalent for one event class, with the field list and
+    the per field handling worked out once here instead of on every event."""
+    event_class_str = str(event_class)
+    field_plan = []
+    for field_name, fld in event_class.__dataclass_fields__.items():
+        if field_name == "event_type" or fld.type not in _plain_field_types:
+            field_plan.append((field_name, True))
+        else:
+            field_plan.append((field_name, False))
+
+    def serializer(event, protocol):
+        event_dict = {"event_class": event_class_str}
+        for field_name, needs_conversion in field_plan:
+            value = getattr(event, field_name)
+            if needs_conversion:
+                value = serialize_value(value, field_name, protocol)
+            event_dict[field_name] = value
+        return event_dict
+    return serializer
+
+def serialize_value(value: Any, field_name: str = None, protocol: int = EVENT_PROTOCOL_V1) -> Any:
     if value is None:
         return None
 
     if isinstance(value, np.ndarray):
+        if protocol >= EVENT_PROTOCOL_V2:
+            # raw bytes in the array's own dtype, no per element conversion
+            value = np.ascontiguousarray(value)
+            return {"__ndarray__": base64.b64encode(value.data).decode('ascii'),
+                    "dtype": value.dtype.str,
+                    "shape": list(value.shape)}
         return value.tolist()
 
     if field_name == "event_type":
@@ -120,14 +193,16 @@ def serialize_value(value: Any, field_name: str = None) -> Any:
         nested_dict = {}
         for nested_field_name in value.__dataclass_fields__:
             nested_value = getattr(value, nested_field_name)
-            nested_dict[nested_field_name] = serialize_value(nested_value, nested_field_name)
+            nested_dict[nested_field_name] = serialize_value(nested_value, nested_field_name, protocol)
         return nested_dict
 
     if isinstance(value, list):
-        return [serialize_value(item) for item in value]
+        return [serialize_value(item, protocol=protocol) for item in value]
 
     if isinstance(value, dict):
-        return {k: serialize_value(v) for k, v in value.items()}
+        return {k: serialize_value(v, protocol=protocol) for k, v in value.items()}
 
     return value
-        
+
+
+_event_serializers = {etype: _make_event_serializer(etype) for etype in event_type_map.values()}
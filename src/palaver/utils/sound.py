@@ -0,0 +1,47 @@
+"""Playback of short sound files, such as the draft start and end signals."""
+
+import asyncio
+from pathlib import Path
+
+
+async def play_sound_file(file_path: Path) -> None:
+    """Play a sound file through the default output device.
+
+    The whole file is loaded up front and fed to PortAudio from a stream
+    callback, so the event loop is free while the sound plays rather than
+    being blocked on a write for every chunk.
+
+    Args:
+        file_path: Path to any file format soundfile can read
+    """
+    # imported here so that PortAudio only gets loaded when something
+    # is actually played
+    import sounddevice as sd
+    import soundfile as sf
+
+    with sf.SoundFile(file_path) as sound_file:
+        sr = sound_file.samplerate
+        data = sound_file.read(dtype="float32", always_2d=True)
+
+    loop = asyncio.get_running_loop()
+    done = asyncio.Event()
+    offset = 0
+
+    def callback(outdata, frames, time_info, status):
+        nonlocal offset
+        chunk = data[offset:offset + frames]
+        outdata[:len(chunk)] = chunk
+        offset += len(chunk)
+        if len(chunk) < frames:
+            outdata[len(chunk):] = 0
+            raise sd.CallbackStop
+
+    out_stream = sd.OutputStream(
+        samplerate=sr,
+        channels=data.shape[1],
+        dtype="float32",
+        callback=callback,
+        finished_callback=lambda: loop.call_soon_threadsafe(done.set),
+    )
+    with out_stream:
+        await done.wait()
@@ -2,6 +2,7 @@ import asyncio
 import contextvars
 import functools
 import logging
+import os
 import traceback
 from typing import Optional, Protocol
 
@@ -46,6 +47,17 @@ class ForcedShutdownSync(ForcedShutdown):
         pass
 
 
+def _loop_factory():
+    # uvloop is opt in, so that tests and callers can compare against the stock loop
+    if os.environ.get("PALAVER_USE_UVLOOP") != "1":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 class TopErrorHandler:
 
     def __init__(self,
@@ -67,8 +79,17 @@ class TopErrorHandler:
         self.sync_error_dict = None
         self.async_error_handled = False
         self.sync_error_handled = False
+        # Set once handle_error has finished with an error, so callers can
+        # wait for the handling to complete instead of guessing with a sleep.
+        self.error_done = asyncio.Event()
 
     async def handle_error(self, task: asyncio.Task, exc: Exception):
+        try:
+            await self._handle_error(task, exc)
+        finally:
+            self.error_done.set()
+
+    async def _handle_error(self, task: asyncio.Task, exc: Exception):
         trace_string = traceback.format_exception(exc)
         error_dict = dict(exception=exc, trace_string=trace_string, task=task)
         self.async_error_dict = error_dict
@@ -165,7 +186,8 @@ class TopErrorHandler:
         token = ERROR_HANDLER.set(self)
         
         try:
-            res = asyncio.run(main_coro(*args, **kwargs))
+            with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+                res = runner.run(main_coro(*args, **kwargs))
             if self.async_error_dict and not self.async_error_handled:
                 self.post_loop_error(self.async_error_dict)
         finally:
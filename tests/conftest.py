@@ -5,8 +5,12 @@ This file is automatically loaded by pytest and provides
 shared fixtures and configuration for all tests.
 """
 import os
+import asyncio
+import logging
 import pytest
 
+from palaver.utils.top_error import get_error_handler
+
 # Set ipdb as the default breakpoint() debugger
 # This makes breakpoint() use ipdb.set_trace instead of pdb.set_trace
 os.environ['PYTHONBREAKPOINT'] = 'ipdb.set_trace'
@@ -61,3 +65,39 @@ def configure_breakpoint():
     yield
     # Cleanup after tests (optional)
     pass
+
+
+@pytest.fixture
+def make_error():
+    """
+    Coroutine function that raises the error the TopErrorHandler tests expect to see.
+    """
+    async def _make_error():
+        raise Exception('error_1')
+    return _make_error
+
+
+@pytest.fixture
+def task_1(make_error):
+    """
+    Coroutine function suitable for TopErrorHandler.wrap_task that fails via make_error.
+    """
+    logger = logging.getLogger("test_code")
+
+    async def _task_1():
+        logger.info('in task_1')
+        await make_error()
+    return _task_1
+
+
+@pytest.fixture
+def main_loop(task_1):
+    """
+    Main coroutine for TopErrorHandler.run that wraps task_1 using the
+    handler found in the current context.
+    """
+    async def _main_loop():
+        handler = get_error_handler()
+        task_1_handle = handler.wrap_task(task_1)
+        await asyncio.wait_for(handler.error_done.wait(), timeout=1.0)
+    return _main_loop
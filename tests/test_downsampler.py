@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from scipy.signal import resample_poly
+
+pytest.importorskip("resampy")
+
+from palaver.scribe.audio.downsampler import PolyphaseResampler
+
+
+def uneven_chunks(data, seed=0):
+    """ Split data into chunks of irregular size, including some single samples """
+    rng = np.random.default_rng(seed)
+    pos = 0
+    while pos < len(data):
+        size = int(rng.choice([1, 7, 441, 480, 1000, 1411, 2048]))
+        yield data[pos:pos + size]
+        pos += size
+
+
+@pytest.mark.parametrize("src_rate", [48000, 44100])
+@pytest.mark.parametrize("channels", [1, 2])
+def test_chunked_matches_resample_poly(src_rate, channels):
+    """ Resampling a stream chunk by chunk gives the same samples as scipy's
+    resample_poly over the whole signal with the same filter."""
+    rng = np.random.default_rng(1)
+    data = rng.standard_normal((src_rate // 2 + 17, channels)).astype(np.float32)
+
+    resampler = PolyphaseResampler(src_rate, 16000, channels)
+    out = np.concatenate([resampler.process(chunk) for chunk in uneven_chunks(data)])
+
+    # PolyphaseResampler is causal where resample_poly removes the filter delay,
+    # leading zeros put that delay back so the outputs line up sample for sample.
+    # resample_poly applies the up factor gain itself.
+    numtaps = len(resampler.taps)
+    window = np.concatenate((np.zeros(numtaps - 1), resampler.taps / resampler.up))
+    expected = resample_poly(data.astype(np.float64), resampler.up, resampler.down,
+                             axis=0, window=window)
+
+    assert out.dtype == np.float32
+    assert out.shape == expected.shape
+    assert len(out) == -(-len(data) * 16000 // src_rate)
+    np.testing.assert_allclose(out, expected, atol=1e-5)
@@ -0,0 +1,54 @@
+"""
+Tests for NetListener's handling of the event stream it gets from EventRouter,
+sequence gap detection and shutting down when the server goes away.
+"""
+import asyncio
+import logging
+
+import orjson
+import pytest
+import websockets
+
+from palaver.scribe.audio.net_listener import NetListener, _READER_DONE
+
+logger = logging.getLogger("test_code")
+
+
+def make_message(seq):
+    # an event class the listener didn't subscribe to, so the dispatcher
+    # checks the seq and then skips it without building an event
+    return orjson.dumps({"event_class": "NotSubscribed", "seq": seq})
+
+
+async def test_dispatcher_counts_seq_gap():
+    listener = NetListener("ws://localhost:1")
+    listener._running = True
+    for seq in (0, 1, 3, 4):
+        await listener._event_queue.put(make_message(seq))
+    await listener._event_queue.put(_READER_DONE)
+
+    await asyncio.wait_for(listener._dispatcher(), timeout=1.0)
+
+    assert listener.gaps == 1
+    assert listener._next_seq == 5
+    assert not listener.is_streaming()
+
+
+async def test_dispatcher_stops_when_server_closes():
+    async def handler(websocket):
+        # take the subscription, send a couple of events then hang up
+        await websocket.recv()
+        for seq in (0, 1):
+            await websocket.send(make_message(seq).decode())
+        await websocket.close()
+
+    async with websockets.serve(handler, "localhost", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        listener = NetListener(f"ws://localhost:{port}")
+        listener._running = True
+        await asyncio.wait_for(asyncio.gather(listener._reader(), listener._dispatcher()),
+                               timeout=2.0)
+
+    assert listener.gaps == 0
+    assert listener._next_seq == 2
+    assert not listener.is_streaming()
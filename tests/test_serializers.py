@@ -0,0 +1,30 @@
+import json
+
+import numpy as np
+import pytest
+
+from palaver.scribe.audio_events import AudioChunkEvent
+from palaver.utils.serializers import (serialize_event, event_from_dict,
+                                       EVENT_PROTOCOL_V1, EVENT_PROTOCOL_V2)
+
+
+@pytest.mark.parametrize("protocol", [EVENT_PROTOCOL_V1, EVENT_PROTOCOL_V2])
+@pytest.mark.parametrize("dtype", [np.float32, np.int16])
+def test_audio_chunk_round_trip(protocol, dtype):
+    """ Chunk data comes back as a writable float32 array of the same shape, whatever
+    the protocol and whatever dtype the sender used."""
+    data = (np.arange(960).reshape(480, 2) % 100).astype(dtype)
+    event = AudioChunkEvent(source_id="test", stream_start_time=0.0,
+                            data=data, duration=0.03, sample_rate=16000,
+                            channels=2, blocksize=480, datatype=np.dtype(dtype).name)
+    # through json text, as it goes over the websocket
+    wire = json.loads(json.dumps(serialize_event(event, protocol)))
+    result = event_from_dict(wire)
+
+    assert isinstance(result, AudioChunkEvent)
+    assert result.data.dtype == np.float32
+    assert result.data.shape == (480, 2)
+    assert result.data.flags.writeable
+    assert np.array_equal(result.data, data.astype(np.float32))
+    assert result.sample_rate == 16000
+    assert result.event_id == event.event_id
@@ -27,7 +27,8 @@ def test_lookup_error():
     with pytest.raises(Exception):
         get_error_handler()
         
-def test_tlc_1():
+@pytest.mark.parametrize("log", [logger, None])
+def test_tlc_1(task_1, log):
 
     error_dict_1 = None
     class MyTLC(TopLevelCallback):
@@ -35,31 +36,20 @@ def test_tlc_1():
         async def on_error(self, error_dict: dict):
             nonlocal error_dict_1
             error_dict_1 = error_dict
-    
-
-    async def make_error():
-        raise Exception('error_1')
 
-    async def task_1():
-        logger.info('in task_1')
-        await make_error()
-        
+    # wrap through the handler directly rather than the context lookup main_loop uses
     async def main_loop():
         task_1_handle = tleh.wrap_task(task_1)
-        await asyncio.sleep(0.001)
+        await asyncio.wait_for(tleh.error_done.wait(), timeout=1.0)
 
     tlc = MyTLC()
-    tleh = TopErrorHandler(top_level_callback=tlc, logger=logger)
+    tleh = TopErrorHandler(top_level_callback=tlc, logger=log)
     error_dict_1 = None
     tleh.run(main_loop)
     assert error_dict_1 is not None
 
-    tleh = TopErrorHandler(top_level_callback=tlc, logger=None)
-    error_dict_1 = None
-    tleh.run(main_loop)
-    assert error_dict_1 is not None
-
-def test_tlc_2():
+@pytest.mark.parametrize("log", [logger, None])
+def test_tlc_2(main_loop, log):
 
     error_dict_1 = None
     class MyTLC(TopLevelCallback):
@@ -67,32 +57,15 @@ def test_tlc_2():
         async def on_error(self, error_dict: dict):
             nonlocal error_dict_1
             error_dict_1 = error_dict
-    
-
-    async def make_error():
-        raise Exception('error_1')
-
-    async def task_1():
-        logger.info('in task_1')
-        await make_error()
-        
-    async def main_loop():
-        handler = get_error_handler()
-        task_1_handle = handler.wrap_task(task_1)
-        await asyncio.sleep(0.001)
 
     tlc = MyTLC()
-    tleh = TopErrorHandler(top_level_callback=tlc, logger=logger)
-    error_dict_1 = None
-    tleh.run(main_loop)
-    assert error_dict_1 is not None
-
-    tleh = TopErrorHandler(top_level_callback=tlc, logger=None)
+    tleh = TopErrorHandler(top_level_callback=tlc, logger=log)
     error_dict_1 = None
     tleh.run(main_loop)
     assert error_dict_1 is not None
 
-def test_csd_1():
+@pytest.mark.parametrize("log", [logger, None])
+def test_csd_1(main_loop, log):
 
     shutdown_flag = None
     class MyCleanDown(CleanShutdown):
@@ -101,30 +74,15 @@ def test_csd_1():
             nonlocal shutdown_flag
             shutdown_flag = msg
 
-    async def make_error():
-        raise Exception('error_1')
-
-    async def task_1():
-        logger.info('in task_1')
-        await make_error()
-        
-    async def main_loop():
-        task_1_handle = tleh.wrap_task(task_1)
-        await asyncio.sleep(0.001)
-
     mcd = MyCleanDown()
-    tleh = TopErrorHandler(clean_shutdown=mcd, logger=logger)
-    shutdown_flag = None
-    tleh.run(main_loop)
-    assert shutdown_flag is not None
-
-    tleh = TopErrorHandler(clean_shutdown=mcd, logger=None)
+    tleh = TopErrorHandler(clean_shutdown=mcd, logger=log)
     shutdown_flag = None
     tleh.run(main_loop)
     assert shutdown_flag is not None
     
 
-def test_fsd_1():
+@pytest.mark.parametrize("log", [logger, None])
+def test_fsd_1(main_loop, log):
 
     shutdown_flag = None
     class MyForcedDown(ForcedShutdown):
@@ -133,31 +91,16 @@ def test_fsd_1():
             nonlocal shutdown_flag
             shutdown_flag = msg
 
-    async def make_error():
-        raise Exception('error_1')
-
-    async def task_1():
-        logger.info('in task_1')
-        await make_error()
-        
-    async def main_loop():
-        task_1_handle = tleh.wrap_task(task_1)
-        await asyncio.sleep(0.001)
-
     mfd = MyForcedDown()
-    tleh = TopErrorHandler(forced_shutdown=mfd, logger=logger)
-    shutdown_flag = None
-    tleh.run(main_loop)
-    assert shutdown_flag is not None
-
-    tleh = TopErrorHandler(forced_shutdown=mfd, logger=None)
+    tleh = TopErrorHandler(forced_shutdown=mfd, logger=log)
     shutdown_flag = None
     tleh.run(main_loop)
     assert shutdown_flag is not None
     
 
 
-def test_tlc_sync_1():
+@pytest.mark.parametrize("log", [logger, None])
+def test_tlc_sync_1(main_loop, log):
 
     error_dict_1 = None
     class MyTLC(TopLevelCallbackSync):
@@ -166,31 +109,15 @@ def test_tlc_sync_1():
             nonlocal error_dict_1
             error_dict_1 = error_dict
 
-    async def make_error():
-        raise Exception('error_1')
-
-    async def task_1():
-        logger.info('in task_1')
-        await make_error()
-        
-    async def main_loop():
-        task_1_handle = tleh.wrap_task(task_1)
-        await asyncio.sleep(0.001)
-
-    tlc = MyTLC()
-    tleh = TopErrorHandler(top_level_callback_sync=tlc, logger=logger)
-    error_dict_1 = None
-    tleh.run(main_loop)
-    assert error_dict_1 is not None
-
     tlc = MyTLC()
-    tleh = TopErrorHandler(top_level_callback_sync=tlc, logger=None)
+    tleh = TopErrorHandler(top_level_callback_sync=tlc, logger=log)
     error_dict_1 = None
     tleh.run(main_loop)
     assert error_dict_1 is not None
 
 
-def test_csd_sync_1():
+@pytest.mark.parametrize("log", [logger, None])
+def test_csd_sync_1(main_loop, log):
 
     shutdown_flag = None
     class MyCleanDown(CleanShutdownSync):
@@ -199,29 +126,14 @@ def test_csd_sync_1():
             nonlocal shutdown_flag
             shutdown_flag = msg
 
-    async def make_error():
-        raise Exception('error_1')
-
-    async def task_1():
-        logger.info('in task_1')
-        await make_error()
-        
-    async def main_loop():
-        task_1_handle = tleh.wrap_task(task_1)
-        await asyncio.sleep(0.001)
-
     mcd = MyCleanDown()
-    tleh = TopErrorHandler(clean_shutdown_sync=mcd, logger=logger)
+    tleh = TopErrorHandler(clean_shutdown_sync=mcd, logger=log)
     shutdown_flag = None
     tleh.run(main_loop)
     assert shutdown_flag is not None
 
-    tleh = TopErrorHandler(clean_shutdown_sync=mcd, logger=None)
-    shutdown_flag = None
-    tleh.run(main_loop)
-    assert shutdown_flag is not None
-
-def test_fsd_sync_1():
+@pytest.mark.parametrize("log", [logger, None])
+def test_fsd_sync_1(main_loop, log):
 
     shutdown_flag = None
     class MyForcedDown(ForcedShutdownSync):
@@ -230,30 +142,15 @@ def test_fsd_sync_1():
             nonlocal shutdown_flag
             shutdown_flag = msg
 
-    async def make_error():
-        raise Exception('error_1')
-
-    async def task_1():
-        logger.info('in task_1')
-        await make_error()
-        
-    async def main_loop():
-        task_1_handle = tleh.wrap_task(task_1)
-        await asyncio.sleep(0.001)
-
     mfd = MyForcedDown()
-    tleh = TopErrorHandler(forced_shutdown_sync=mfd, logger=logger)
-    shutdown_flag = None
-    tleh.run(main_loop)
-    assert shutdown_flag is not None
-
-    tleh = TopErrorHandler(forced_shutdown_sync=mfd, logger=None)
+    tleh = TopErrorHandler(forced_shutdown_sync=mfd, logger=log)
     shutdown_flag = None
     tleh.run(main_loop)
     assert shutdown_flag is not None
     
     
-def test_bad_tcl_1():
+@pytest.mark.parametrize("log", [logger, None])
+def test_bad_tcl_1(main_loop, log):
 
     error_dict_1 = None
     class MyTLCError(TopLevelCallback):
@@ -267,31 +164,16 @@ def test_bad_tcl_1():
             nonlocal error_dict_1
             error_dict_1 = error_dict
 
-    async def make_error():
-        raise Exception('error_1')
-
-    async def task_1():
-        logger.info('in task_1')
-        await make_error()
-        
-    async def main_loop():
-        task_1_handle = tleh.wrap_task(task_1)
-        await asyncio.sleep(0.001)
-
     tlc_error = MyTLCError()
     tlc_sync = MyTLCSync()
-    tleh = TopErrorHandler(top_level_callback=tlc_error, top_level_callback_sync=tlc_sync, logger=logger)
-    error_dict_1 = None
-    tleh.run(main_loop)
-    assert error_dict_1 is not None
-
-    tleh = TopErrorHandler(top_level_callback=tlc_error, top_level_callback_sync=tlc_sync, logger=None)
+    tleh = TopErrorHandler(top_level_callback=tlc_error, top_level_callback_sync=tlc_sync, logger=log)
     error_dict_1 = None
     tleh.run(main_loop)
     assert error_dict_1 is not None
 
 
-def test_bad_csd_1():
+@pytest.mark.parametrize("log", [logger, None])
+def test_bad_csd_1(main_loop, log):
 
     shutdown_flag = None
     class MyCleanShutdownError(CleanShutdown):
@@ -305,31 +187,16 @@ def test_bad_csd_1():
             nonlocal shutdown_flag
             shutdown_flag = msg
 
-    async def make_error():
-        raise Exception('error_1')
-
-    async def task_1():
-        logger.info('in task_1')
-        await make_error()
-        
-    async def main_loop():
-        task_1_handle = tleh.wrap_task(task_1)
-        await asyncio.sleep(0.001)
-
     mcd_error = MyCleanShutdownError()
     mcd = MyCleanDown()
-    tleh = TopErrorHandler(clean_shutdown=mcd_error, clean_shutdown_sync=mcd, logger=logger)
-    shutdown_flag = None
-    tleh.run(main_loop)
-    assert shutdown_flag is not None
-
-    tleh = TopErrorHandler(clean_shutdown=mcd_error, clean_shutdown_sync=mcd, logger=None)
+    tleh = TopErrorHandler(clean_shutdown=mcd_error, clean_shutdown_sync=mcd, logger=log)
     shutdown_flag = None
     tleh.run(main_loop)
     assert shutdown_flag is not None
 
     
-def test_bad_fsd_1():
+@pytest.mark.parametrize("log", [logger, None])
+def test_bad_fsd_1(main_loop, log):
 
     shutdown_flag = None
     class MyForcedDown(ForcedShutdownSync):
@@ -343,30 +210,16 @@ def test_bad_fsd_1():
         def shutdown(self, msg):
             raise Exception("error in forced shutdown async")
 
-    async def make_error():
-        raise Exception('error_1')
-
-    async def task_1():
-        logger.info('in task_1')
-        await make_error()
-        
-    async def main_loop():
-        task_1_handle = tleh.wrap_task(task_1)
-        await asyncio.sleep(0.001)
 
     mfd_error = MyForcedDownError()
     mfd = MyForcedDown()
-    tleh = TopErrorHandler(forced_shutdown=mfd_error, forced_shutdown_sync=mfd, logger=logger)
-    shutdown_flag = None
-    tleh.run(main_loop)
-    assert shutdown_flag is not None
-
-    tleh = TopErrorHandler(forced_shutdown=mfd_error, forced_shutdown_sync=mfd, logger=None)
+    tleh = TopErrorHandler(forced_shutdown=mfd_error, forced_shutdown_sync=mfd, logger=log)
     shutdown_flag = None
     tleh.run(main_loop)
     assert shutdown_flag is not None
     
-def test_bad_tcl_2():
+@pytest.mark.parametrize("log", [logger, None])
+def test_bad_tcl_2(main_loop, log):
 
     error_dict_1 = None
     class MyTLCError(TopLevelCallback):
@@ -379,32 +232,16 @@ def test_bad_tcl_2():
         def on_error(self, error_dict: dict):
             raise Exception("error in sync on_error")
 
-    async def make_error():
-        raise Exception('error_1')
-
-    async def task_1():
-        logger.info('in task_1')
-        await make_error()
-        
-    async def main_loop():
-        task_1_handle = tleh.wrap_task(task_1)
-        await asyncio.sleep(0.001)
-
     tlc_error = MyTLCError()
     tlc_sync = MyTLCSyncError()
-    tleh = TopErrorHandler(top_level_callback=tlc_error, top_level_callback_sync=tlc_sync, logger=logger)
+    tleh = TopErrorHandler(top_level_callback=tlc_error, top_level_callback_sync=tlc_sync, logger=log)
     error_dict_1 = None
     with pytest.raises(ErrorHandlingException):
         tleh.run(main_loop)
     assert error_dict_1 is  None
 
-    tleh = TopErrorHandler(top_level_callback=tlc_error, top_level_callback_sync=tlc_sync, logger=None)
-    error_dict_1 = None
-    with pytest.raises(ErrorHandlingException):
-        tleh.run(main_loop)
-    assert error_dict_1 is None
-
-def test_bad_csd_2():
+@pytest.mark.parametrize("log", [logger, None])
+def test_bad_csd_2(main_loop, log):
 
     shutdown_flag = None
     class MyCleanShutdownError(CleanShutdown):
@@ -417,33 +254,18 @@ def test_bad_csd_2():
         def shutdown(self, msg):
             raise Exception("sync shutdown error")
 
-    async def make_error():
-        raise Exception('error_1')
-
-    async def task_1():
-        logger.info('in task_1')
-        await make_error()
-        
-    async def main_loop():
-        task_1_handle = tleh.wrap_task(task_1)
-        await asyncio.sleep(0.001)
 
     mcd_error = MyCleanShutdownError()
     mcd_sync_error = MyCleanDownSyncError()
-    tleh = TopErrorHandler(clean_shutdown=mcd_error, clean_shutdown_sync=mcd_sync_error, logger=logger)
-    shutdown_flag = None
-    with pytest.raises(ErrorHandlingException):
-        tleh.run(main_loop)
-    assert shutdown_flag is None
-
-    tleh = TopErrorHandler(clean_shutdown=mcd_error, clean_shutdown_sync=mcd_sync_error, logger=None)
+    tleh = TopErrorHandler(clean_shutdown=mcd_error, clean_shutdown_sync=mcd_sync_error, logger=log)
     shutdown_flag = None
     with pytest.raises(ErrorHandlingException):
         tleh.run(main_loop)
     assert shutdown_flag is None
 
     
-def test_bad_fsd_2():
+@pytest.mark.parametrize("log", [logger, None])
+def test_bad_fsd_2(main_loop, log):
 
     shutdown_flag = None
     class MyForcedDownSyncError(ForcedShutdownSync):
@@ -456,33 +278,17 @@ def test_bad_fsd_2():
         def shutdown(self, msg):
             raise Exception("error in forced shutdown async")
 
-    async def make_error():
-        raise Exception('error_1')
-
-    async def task_1():
-        logger.info('in task_1')
-        await make_error()
-        
-    async def main_loop():
-        task_1_handle = tleh.wrap_task(task_1)
-        await asyncio.sleep(0.001)
 
     mfd_error = MyForcedDownError()
     mfd_sync = MyForcedDownSyncError()
-    tleh = TopErrorHandler(forced_shutdown=mfd_error, forced_shutdown_sync=mfd_sync, logger=logger)
-    shutdown_flag = None
-    with pytest.raises(ErrorHandlingException):
-        tleh.run(main_loop)
-    assert shutdown_flag is None
-
-    tleh = TopErrorHandler(forced_shutdown=mfd_error, forced_shutdown_sync=mfd_sync, logger=None)
+    tleh = TopErrorHandler(forced_shutdown=mfd_error, forced_shutdown_sync=mfd_sync, logger=log)
     shutdown_flag = None
     with pytest.raises(ErrorHandlingException):
         tleh.run(main_loop)
     assert shutdown_flag is None
     
 
-def test_use_most_1():
+def test_use_most_1(main_loop):
     
     error_dict_1 = None
     class MyTLC(TopLevelCallback):
@@ -505,16 +311,6 @@ def test_use_most_1():
             nonlocal forced_shutdown_flag
             forced_shutdown_flag = msg
             
-    async def make_error():
-        raise Exception('error_1')
-
-    async def task_1():
-        logger.info('in task_1')
-        await make_error()
-        
-    async def main_loop():
-        task_1_handle = tleh.wrap_task(task_1)
-        await asyncio.sleep(0.001)
 
     tlc = MyTLC()
     csd = MyCleanDown()
@@ -560,3 +356,24 @@ def test_use_most_1():
     assert shutdown_flag is None
     assert forced_shutdown_flag is not None
 
+
+
+def test_uvloop_opt_in(main_loop, monkeypatch):
+    uvloop = pytest.importorskip("uvloop")
+
+    loop_type = None
+    class MyTLC(TopLevelCallback):
+
+        async def on_error(self, error_dict: dict):
+            nonlocal loop_type
+            loop_type = type(asyncio.get_running_loop())
+
+    monkeypatch.setenv("PALAVER_USE_UVLOOP", "1")
+    tleh = TopErrorHandler(top_level_callback=MyTLC(), logger=logger)
+    tleh.run(main_loop)
+    assert loop_type is uvloop.Loop
+
+    monkeypatch.delenv("PALAVER_USE_UVLOOP")
+    tleh = TopErrorHandler(top_level_callback=MyTLC(), logger=logger)
+    tleh.run(main_loop)
+    assert loop_type is not uvloop.Loop
@@ -0,0 +1,48 @@
+"""
+Smoke test for the whisper worker process, checks that a spawned worker
+starts and that its log records come back to the parent through log_queue.
+"""
+import logging
+import logging.handlers
+
+import pytest
+
+pytest.importorskip("pywhispercpp")
+
+from palaver.scribe.scriven.whisper import (_mp_context,
+                                            _ForwardToLogger,
+                                            process_worker_wrapper,
+                                            )
+
+
+def test_spawned_worker_forwards_logs(tmp_path, caplog):
+    caplog.set_level(logging.INFO, logger="WhisperWrapper")
+    job_queue = _mp_context.Queue()
+    result_queue = _mp_context.Queue()
+    error_queue = _mp_context.Queue()
+    shutdown_event = _mp_context.Event()
+    log_queue = _mp_context.Queue()
+
+    # no model at this path, so the worker logs its start, fails to load
+    # the model and reports that on error_queue, without any download
+    model_path = tmp_path / "no_such_model.bin"
+    listener = logging.handlers.QueueListener(log_queue, _ForwardToLogger())
+    listener.start()
+    try:
+        process = _mp_context.Process(target=process_worker_wrapper,
+                                      args=[job_queue, result_queue, error_queue,
+                                            shutdown_event, model_path,
+                                            log_queue, logging.INFO])
+        process.start()
+        error_dict = error_queue.get(timeout=60)
+        process.join(timeout=10)
+        assert not process.is_alive()
+    finally:
+        listener.stop()
+
+    assert "traceback" in error_dict
+    worker_records = [r for r in caplog.records
+                      if r.name == "WhisperWrapper" and r.process == process.pid]
+    messages = [r.getMessage() for r in worker_records]
+    assert any("starting" in m for m in messages)
+    assert any("exiting on error" in m for m in messages)
@@ -26,8 +26,10 @@ import argparse
 import json
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict
+import numpy as np
 import soundfile as sf
 import sounddevice as sd
 
@@ -147,11 +149,18 @@ def play_audio_file(file_path: Path) -> None:
         )
         out_stream.start()
 
-        while True:
-            data = sound_file.read(frames=frames_per_chunk, dtype="float32", always_2d=True)
-            if data.shape[0] == 0:
-                break
-            out_stream.write(data)
+        # Two buffers reused for every chunk, so the next chunk can be
+        # decoded in a thread while the current one is being written.
+        # Both calls release the GIL.
+        bufs = [np.empty((frames_per_chunk, channels), dtype="float32") for _ in range(2)]
+        with ThreadPoolExecutor(max_workers=1) as reader:
+            i = 0
+            frames = sound_file.buffer_read_into(bufs[i], dtype="float32")
+            while frames > 0:
+                next_read = reader.submit(sound_file.buffer_read_into, bufs[1 - i], "float32")
+                out_stream.write(bufs[i][:frames])
+                frames = next_read.result()
+                i = 1 - i
 
         out_stream.close()
         sound_file.close()